@@ -19,8 +19,24 @@ Quick start::
 
 __version__ = "1.0.0"
 
+from typing import TYPE_CHECKING
+
 from .colors import PROTEIN_VISUAL_COLORS, resolve_visual_color  # noqa: F401
-from .mock import OpentronsMock, simulate_protocol  # noqa: F401
+
+if TYPE_CHECKING:
+    from .mock import OpentronsMock, simulate_protocol  # noqa: F401
+
+# Exports that pull in opentrons and matplotlib, loaded on first access so
+# `import opentrons_bioart_sim` (and the CLI's --help/--version) stays fast
+_LAZY_EXPORTS = {"OpentronsMock", "simulate_protocol"}
+
+
+def __getattr__(name: str) -> object:
+    if name in _LAZY_EXPORTS:
+        from . import mock
+        return getattr(mock, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "OpentronsMock",
@@ -0,0 +1,300 @@
+"""
+_protocol_core.py — Shared run() logic for the bundled example protocols
+========================================================================
+The hand-maintained examples (``example.py``, ``htgaa.py``, ``octocat.py``) only
+differ in their point lists and droplet size. They delegate ``run(protocol)`` to
+:func:`run_protocol`, so the deck setup and the aspirate/dispense loop live in
+one place. The ``OTDesign_*`` files stay verbatim Art Designer exports.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+import numpy as np
+from opentrons import types
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# Deck setup constants
+# ═══════════════════════════════════════════════════════════════════════
+
+Z_VALUE_AGAR: float = 2.0
+TIP_RACK_DECK_SLOT: int = 9
+COLORS_DECK_SLOT: int = 6
+AGAR_DECK_SLOT: int = 5
+PIPETTE_STARTING_TIP_WELL: str = 'A1'
+WELL_MAX_VOLUME: float = 250  # µL drawn from one well before moving to the next row
+LAST_ROW: str = 'H'  # last row of the 96-well color plate
+X_GROUP_TOL: float = 2.2  # mm — column width for point_order='columns' (Art Designer grid pitch)
+_Z_UP = types.Point(z=2)  # hover offset above each dispense point
+
+# Place the PCR tubes in this order. Read-only baseline: every run works on
+# its own copy, so a well rollover never leaks into the next run
+WELL_COLORS: Mapping[str, str] = MappingProxyType({
+    'A1': 'sfGFP',
+    'A2': 'mRFP1',
+    'A3': 'mKO2',
+    'A4': 'Venus',
+    'A5': 'mKate2_TF',
+    'A6': 'Azurite',
+    'A7': 'mCerulean3',
+    'A8': 'mClover3',
+    'A9': 'mJuniper',
+    'A10': 'mTurquoise2',
+    'A11': 'mBanana',
+    'A12': 'mPlum',
+    'B1': 'Electra2',
+    'B2': 'mWasabi',
+    'B3': 'mScarlet_I',
+    'B4': 'mPapaya',
+    'B5': 'eqFP578',
+    'B6': 'tdTomato',
+    'B7': 'DsRed',
+    'B8': 'mKate2',
+    'B9': 'EGFP',
+    'B10': 'mRuby2',
+    'B11': 'TagBFP',
+    'B12': 'mChartreuse_TF',
+    'C1': 'mLychee_TF',
+    'C2': 'mTagBFP2',
+    'C3': 'mEGFP',
+    'C4': 'mNeonGreen',
+    'C5': 'mAzamiGreen',
+    'C6': 'mWatermelon',
+    'C7': 'avGFP',
+    'C8': 'mCitrine',
+    'C9': 'mVenus',
+    'C10': 'mCherry',
+    'C11': 'mHoneydew',
+    'C12': 'TagRFP',
+    'D1': 'mTFP1',
+    'D2': 'Ultramarine',
+    'D3': 'ZsGreen1',
+    'D4': 'mMiCy',
+    'D5': 'mStayGold2',
+    'D6': 'PA_GFP',
+})
+
+# Same layout with colors lowercased once at import for case-insensitive
+# lookups; WELL_COLORS keeps the display names used for rendering
+_WELL_COLORS_LC: Mapping[str, str] = MappingProxyType(
+    {well: color.lower() for well, color in WELL_COLORS.items()}
+)
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# Helpers
+# ═══════════════════════════════════════════════════════════════════════
+
+def dispense_and_jog(pipette: object, volume: float, location: types.Location) -> None:
+    """Hover above ``location``, dispense, then lift back up to avoid smearing."""
+    assert isinstance(volume, (int, float))
+    above = location.move(_Z_UP)
+    # Go above the location
+    pipette.move_to(above)
+    # Go downwards and dispense
+    pipette.dispense(volume, location)
+    # Go upwards to avoid smearing
+    pipette.move_to(above)
+
+
+def _nn_order(points: np.ndarray) -> np.ndarray:
+    """Reorder (N, 2) points into a greedy nearest-neighbor path.
+
+    Starts at the leftmost point (lowest Y breaks ties) and always moves to the
+    closest unvisited point, shortening XY travel between dispenses. O(N²), which
+    is negligible for the few hundred points of a design. Lists shorter than 4
+    points are returned unchanged.
+    """
+    n = len(points)
+    if n < 4:
+        return points
+    order = np.empty(n, dtype=np.intp)
+    visited = np.zeros(n, dtype=bool)
+    current = int(np.lexsort((points[:, 1], points[:, 0]))[0])
+    for k in range(n):
+        order[k] = current
+        visited[current] = True
+        if k + 1 < n:
+            dist = ((points - points[current]) ** 2).sum(axis=1)
+            dist[visited] = np.inf
+            current = int(dist.argmin())
+    return points[order]
+
+
+def _column_order(points: np.ndarray, tol: float = X_GROUP_TOL) -> np.ndarray:
+    """Reorder (N, 2) points column by column, snaking up and down.
+
+    Points are bucketed into X-columns ``tol`` mm wide and each column is finished
+    before moving right. The Y direction alternates between columns, so the
+    pipette never reverses within a column nor jumps back to the bottom.
+    """
+    if len(points) < 2:
+        return points
+    # The epsilon keeps grid lines on multiples of tol in their own column
+    # (6.6 / 2.2 == 2.9999999999999996 would otherwise floor into column 2)
+    column = np.floor(points[:, 0] / tol + 1e-9).astype(np.intp)
+    _, rank = np.unique(column, return_inverse=True)
+    y = np.where(rank % 2 == 1, -points[:, 1], points[:, 1])
+    return points[np.lexsort((y, column))]
+
+
+def _given_order(points: np.ndarray) -> np.ndarray:
+    return points
+
+
+_POINT_ORDERS = {
+    'nearest': _nn_order,
+    'columns': _column_order,
+    'given': _given_order,
+}
+
+
+# ═══════════════════════════════════════════════════════════════════════
+# Protocol body
+# ═══════════════════════════════════════════════════════════════════════
+
+def run_protocol(
+    protocol: object,
+    point_name_pairing: list[tuple[str, np.ndarray | list[tuple[float, float]]]],
+    point_size: float,
+    well_colors: Optional[dict[str, str]] = None,
+    point_order: str = 'nearest',
+) -> None:
+    """Print every color's point list onto the agar plate.
+
+    Args:
+        protocol: ProtocolContext (or OpentronsMock) passed to ``run()``.
+        point_name_pairing: List of (color name, points) in print order, where
+                            points is an (N, 2) array or a list of (x, y) tuples.
+        point_size: Volume in µL dispensed per point.
+        well_colors: Dict mapping well ID → color name. Updated in place when a
+                     color runs dry and moves to the next row (which must be
+                     empty). Defaults to a fresh copy of ``WELL_COLORS``.
+        point_order: Dispense order within each color: 'nearest' (greedy
+                     nearest-neighbor path), 'columns' (X-columns of width
+                     ``X_GROUP_TOL``), or 'given' (list order).
+
+    Raises:
+        ValueError: If point_order is not one of the above, or a color needs
+                    more than ``WELL_MAX_VOLUME`` and cannot move to the next row.
+    """
+    if point_order not in _POINT_ORDERS:
+        raise ValueError(
+            f"Unknown point_order: {point_order!r} — must be one of {sorted(_POINT_ORDERS)}"
+        )
+    reorder = _POINT_ORDERS[point_order]
+    if well_colors is None:
+        well_colors = dict(WELL_COLORS)
+
+    # Per-run volume bookkeeping, and color (lowercased) -> well currently
+    # supplying it; first well wins for duplicate colors
+    if well_colors == WELL_COLORS:
+        colors_lc = _WELL_COLORS_LC
+    else:
+        colors_lc = {well: color.lower() for well, color in well_colors.items()}
+    volume_used: defaultdict[str, float] = defaultdict(float)
+    active_well_for_color = {color: well for well, color in reversed(colors_lc.items())}
+
+    def update_volume_remaining(color_key: str, quantity_to_aspirate: float) -> bool:
+        """Account for an aspirate; return True if the color moved to a fresh well.
+
+        Raises:
+            ValueError: If the well would run dry and the next row's well is
+                        occupied or off the plate.
+        """
+        well = active_well_for_color.get(color_key)
+        if well is None:
+            return False
+        if volume_used[color_key] + quantity_to_aspirate > WELL_MAX_VOLUME:
+            # Move to next well horizontally by advancing row letter, keeping column
+            # number; the new well keeps the display name of the one it replaces
+            next_well = f"{chr(ord(well[0]) + 1)}{well[1:]}"
+            if next_well[0] > LAST_ROW or next_well in well_colors:
+                where = 'off the plate' if next_well[0] > LAST_ROW else \
+                    f"already holds {well_colors[next_well]}"
+                raise ValueError(
+                    f"{well_colors[well]} needs more than {WELL_MAX_VOLUME}µL, but the"
+                    f" next well {next_well} {where} — leave it empty for the refill"
+                )
+            well_colors[next_well] = well_colors.pop(well)
+            active_well_for_color[color_key] = next_well
+            volume_used[color_key] = quantity_to_aspirate
+            return True
+        volume_used[color_key] += quantity_to_aspirate
+        return False
+
+    # Load labware, modules and pipettes
+    protocol.home()
+
+    # Tips
+    tips_20ul = protocol.load_labware('opentrons_96_tiprack_20ul', TIP_RACK_DECK_SLOT,
+                                      'Opentrons 20uL Tips')
+
+    # Pipettes
+    pipette_20ul = protocol.load_instrument("p20_single_gen2", "right", [tips_20ul])
+
+    # Deep Well Plate
+    temperature_plate = protocol.load_labware('nest_96_wellplate_2ml_deep', COLORS_DECK_SLOT)
+
+    # Agar Plate
+    agar_plate = protocol.load_labware('htgaa_agar_plate', AGAR_DECK_SLOT, 'Agar Plate')
+    agar_plate.set_offset(x=0.00, y=0.00, z=Z_VALUE_AGAR)
+
+    # Get the top-center of the plate, make sure the plate was calibrated before running this
+    center_location = agar_plate['A1'].top()
+
+    pipette_20ul.starting_tip = tips_20ul.well(PIPETTE_STARTING_TIP_WELL)
+
+    def location_of_color(color_key: str) -> object:
+        try:
+            well = active_well_for_color[color_key]
+        except KeyError:
+            raise ValueError(f"No well found with color {color_key}") from None
+        return temperature_plate[well]
+
+    # Print pattern by iterating over lists, one aspirate per chunk of points
+    # (18µL per aspirate keeps clear of the 20µL pipette maximum)
+    points_per_aspirate = int(18 // point_size)
+    for current_color, point_list in point_name_pairing:
+        # Skip the rest of the loop if the list is empty
+        n = len(point_list)
+        if n == 0:
+            continue
+
+        # Get the tip for this color
+        pipette_20ul.pick_up_tip()
+        color_key = current_color.lower()
+        source_location = None
+
+        # Shorten the travel path, then translate the whole point list to plate
+        # coordinates in one vectorized add
+        center = center_location.point
+        points = reorder(np.asarray(point_list, dtype=np.float64))
+        plate_xy = (points + (center.x, center.y)).tolist()
+
+        for start in range(0, n, points_per_aspirate):
+            stop = min(start + points_per_aspirate, n)
+            quantity_to_aspirate = (stop - start) * point_size
+            if update_volume_remaining(color_key, quantity_to_aspirate):
+                if source_location is not None:
+                    # Moved to a fresh well mid-color: take a fresh tip too, so
+                    # one tip never aspirates from two wells
+                    pipette_20ul.drop_tip()
+                    pipette_20ul.pick_up_tip()
+                source_location = location_of_color(color_key)
+            elif source_location is None:
+                # Only look the well up again if the color moved to a fresh one
+                source_location = location_of_color(color_key)
+            pipette_20ul.aspirate(quantity_to_aspirate, source_location)
+
+            for x, y in plate_xy[start:stop]:
+                adjusted_location = types.Location(types.Point(x, y, center.z),
+                                                   center_location.labware)
+                dispense_and_jog(pipette_20ul, point_size, adjusted_location)
+
+        # Drop tip between each color
+        pipette_20ul.drop_tip()
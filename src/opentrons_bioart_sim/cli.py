@@ -17,8 +17,8 @@ import sys
 from . import __version__
 
 
-def main(argv: list[str] | None = None) -> None:
-    """Main entry point for the opentrons-bioart-sim CLI."""
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the opentrons-bioart-sim CLI."""
     parser = argparse.ArgumentParser(
         prog="opentrons-bioart-sim",
         description="Simulate and visualize Opentrons OT-2 bio-art protocols locally.",
@@ -72,9 +72,18 @@ def main(argv: list[str] | None = None) -> None:
         action="version",
         version=f"%(prog)s {__version__}",
     )
+    return parser
 
-    args = parser.parse_args(argv)
 
+def run(args: argparse.Namespace) -> int:
+    """Simulate the protocol described by parsed CLI arguments.
+
+    Returns:
+        Process exit code: 0 on success, 1 if the protocol is missing or fails.
+    """
+    # Imported only once there is a protocol to run: the mock pulls in opentrons
+    # and numpy, which --help, --version and usage errors never need
+    # (guarded by test_cli_import_budget)
     from .mock import simulate_protocol
 
     print(f"Simulating protocol: {args.protocol}")
@@ -90,16 +99,25 @@ def main(argv: list[str] | None = None) -> None:
             show=not args.no_show,
             dpi=args.dpi,
             verbose=args.verbose,
+            headless=args.no_show,
         )
     except FileNotFoundError:
         print(f"Error: File not found: '{args.protocol}'", file=sys.stderr)
-        sys.exit(1)
+        return 1
     except Exception as e:
         print(f"Error running protocol: {e}", file=sys.stderr)
-        sys.exit(1)
+        return 1
 
     print(f"\n{'─' * 50}")
     print("Simulation completed")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Main entry point for the opentrons-bioart-sim CLI."""
+    exit_code = run(build_parser().parse_args(argv))
+    if exit_code:
+        sys.exit(exit_code)
 
 
 if __name__ == "__main__":
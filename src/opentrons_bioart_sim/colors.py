@@ -4,6 +4,10 @@ colors.py — Fluorescent protein color mappings for Opentrons Bio-Art visualiza
 Maps fluorescent protein names to matplotlib-compatible colors for Petri dish rendering.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
 # ═══════════════════════════════════════════════════════════════════════
 # Petri dish constants
 # ═══════════════════════════════════════════════════════════════════════
@@ -15,7 +19,7 @@ MAX_DRAW_RADIUS: float = PETRI_INNER_DIAMETER / 2 - 2  # 2mm margin for tip size
 # Protein → visual color mapping
 # ═══════════════════════════════════════════════════════════════════════
 
-PROTEIN_VISUAL_COLORS: dict[str, str] = {
+_PROTEIN_VISUAL_COLORS: dict[str, str] = {
     # Reds / Pinks
     'mrfp1':            'red',
     'mcherry':          'firebrick',
@@ -65,10 +69,21 @@ PROTEIN_VISUAL_COLORS: dict[str, str] = {
     'mplum':            'purple',
 }
 
+# Read-only view: keys are canonical (lowercase), and resolve_visual_color()
+# results can be cached safely because the table never changes
+PROTEIN_VISUAL_COLORS: Mapping[str, str] = MappingProxyType(_PROTEIN_VISUAL_COLORS)
+
+# Everything resolve_visual_color() translates, keyed by lowercase name, so a
+# lookup is a single dict probe ('green' is brightened for dark backgrounds)
+_VISUAL_LOOKUP: dict[str, str] = {**_PROTEIN_VISUAL_COLORS, 'green': 'lime'}
 
+
+@lru_cache(maxsize=256)
 def resolve_visual_color(protein_or_color_name: str) -> str:
     """Resolve a fluorescent protein name or color name to a matplotlib color.
 
+    Results are memoized, so repeated lookups of the same name are free.
+
     Lookup order:
       1. Check PROTEIN_VISUAL_COLORS (case-insensitive)
       2. Map 'green' → 'lime' for better visibility on dark backgrounds
@@ -80,9 +95,8 @@ def resolve_visual_color(protein_or_color_name: str) -> str:
     Returns:
         A matplotlib-compatible color string.
     """
-    key = protein_or_color_name.lower().strip()
-    if key in PROTEIN_VISUAL_COLORS:
-        return PROTEIN_VISUAL_COLORS[key]
-    if key == 'green':
-        return 'lime'
-    return protein_or_color_name
+    # Fast path: already-canonical names skip the lower()/strip() copy
+    visual = _VISUAL_LOOKUP.get(protein_or_color_name)
+    if visual is not None:
+        return visual
+    return _VISUAL_LOOKUP.get(protein_or_color_name.lower().strip(), protein_or_color_name)
@@ -9,12 +9,15 @@ without physical hardware.
 from __future__ import annotations
 
 import warnings
+from types import CodeType, ModuleType
 from typing import Optional
 
+import numpy as np
+from numpy.typing import ArrayLike
 from opentrons import types
 
 from .colors import MAX_DRAW_RADIUS, resolve_visual_color
-from .visualization import visualize_petri
+from .visualization import rgba_table, visualize_petri, visualize_petri_headless
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -22,21 +25,14 @@ from .visualization import visualize_petri
 # ═══════════════════════════════════════════════════════════════════════
 
 _null_location = types.Location(types.Point(x=250, y=250, z=250), None)
+_INITIAL_DROPLET_CAPACITY = 1024
+_NUMBER = (int, float)  # exact types tried first; isinstance() covers subclasses (np.float64)
+_MAX_DRAW_R2 = MAX_DRAW_RADIUS * MAX_DRAW_RADIUS  # squared radius for the per-dispense bounds check
 
 
-def _mock_print(msg: str, verbose: bool = False) -> None:
-    """Print debug message when verbose mode is enabled."""
-    if verbose:
-        print("... " + msg)
-
-
-def _same_2d_location(loc1: types.Location, loc2: types.Location) -> bool:
-    """Compare two locations ignoring Z (only X, Y, and labware)."""
-    return (
-        loc1.point.x == loc2.point.x
-        and loc1.point.y == loc2.point.y
-        and loc1.labware == loc2.labware
-    )
+def _mock_print(msg: str) -> None:
+    """Print a debug message; callers check verbose first so it is never formatted."""
+    print("... " + msg)
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -50,20 +46,24 @@ class WellMock:
     the fluorescent protein or reagent it contains.
     """
 
+    __slots__ = ('well_id', 'labware_official_name', 'well_color', '_rc')
+
     def __init__(self, well_id: str, well_color: str, labware_official_name: object) -> None:
         self.well_id = well_id
         self.labware_official_name = labware_official_name
         self.well_color = well_color if well_color else 'purple'
+        self._rc: Optional[tuple[int, int]] = None  # parsed lazily by get_row_col
 
     def get_row_col(self) -> tuple[int, int]:
         """Return (row_ordinal, column_number) for this well."""
-        row = ord(self.well_id[0].upper())
-        col = int(self.well_id[1:])
-        return (row, col)
+        if self._rc is None:
+            self._rc = (ord(self.well_id[0].upper()), int(self.well_id[1:]))
+        return self._rc
 
     def set_row_col(self, row: int, col: int) -> None:
         """Set the well ID from row ordinal and column number."""
         self.well_id = chr(row) + str(col)
+        self._rc = (row, col)
 
     def color(self) -> str:
         """Return the raw color/protein name associated with this well."""
@@ -84,16 +84,28 @@ class WellMock:
 
     def top(self, z: float = 0) -> types.Location:
         """Simulate Well.top() — returns a Location at the top of the well."""
-        assert isinstance(z, (int, float))
+        if __debug__ and type(z) not in _NUMBER and not isinstance(z, _NUMBER):
+            raise TypeError(f"top() z must be a number, got {type(z).__name__}")
         return types.Location(types.Point(x=0, y=0, z=z), 'Well')
 
     def move(self, location: types.Location) -> WellMock:
         """Simulate Well.move() — returns self for chaining."""
-        assert isinstance(location, types.Location)
+        if __debug__ and type(location) is not types.Location:
+            raise TypeError(f"move() requires a types.Location, got {type(location).__name__}")
         return self
 
     def __eq__(self, other: object) -> bool:
-        return self.__class__ == other.__class__ and self.__dict__ == other.__dict__
+        # Labware caches its wells, so the identity check settles most calls;
+        # otherwise two wells are equal if they are the same slot of the same labware
+        if self is other:
+            return True
+        if type(other) is not WellMock:
+            return False
+        return (self.well_id == other.well_id
+                and self.labware_official_name is other.labware_official_name)
+
+    def __hash__(self) -> int:
+        return hash((self.well_id, id(self.labware_official_name)))
 
     def __repr__(self) -> str:
         return self.well_id
@@ -106,6 +118,9 @@ class WellMock:
 class LabwareMock:
     """Simulates an Opentrons Labware (well plates, tip racks, custom plates)."""
 
+    __slots__ = ('labware_official_name', 'deck_slot', 'display_name', 'well_colors', 'verbose',
+                 '_wells_cache')
+
     def __init__(
         self,
         labware_official_name: str,
@@ -119,10 +134,20 @@ class LabwareMock:
         self.display_name = display_name
         self.well_colors = well_colors
         self.verbose = verbose
+        self._wells_cache: dict[str, WellMock] = {}
 
     def well(self, well_id: str) -> WellMock:
-        """Return a WellMock for the given well ID."""
-        return WellMock(well_id, self.well_colors.get(well_id, ''), self)
+        """Return the WellMock for the given well ID.
+
+        The same instance is returned on every call, unless it no longer
+        matches: the well's color in well_colors has changed since (e.g. a
+        color moved to the next row), or a caller moved it with set_row_col().
+        """
+        well = self._wells_cache.get(well_id)
+        color = self.well_colors.get(well_id, '')
+        if well is None or well.well_id != well_id or well.well_color != (color or 'purple'):
+            well = self._wells_cache[well_id] = WellMock(well_id, color, self)
+        return well
 
     def wells(self) -> list[WellMock]:
         """Return a list of all WellMock objects in this labware."""
@@ -130,11 +155,10 @@ class LabwareMock:
 
     def set_offset(self, x: float = 0, y: float = 0, z: float = 0) -> None:
         """No-op in simulation — on the real robot this adjusts calibration offset."""
-        _mock_print(f"set_offset(x={x}, y={y}, z={z}) on {self.display_name}",
-                    self.verbose)
+        if self.verbose:
+            _mock_print(f"set_offset(x={x}, y={y}, z={z}) on {self.display_name}")
 
-    def __getitem__(self, well_id: str) -> WellMock:
-        return WellMock(well_id, self.well_colors.get(well_id, ''), self)
+    __getitem__ = well
 
     def __repr__(self) -> str:
         return f"Deck Slot {self.deck_slot} - {self.display_name}"
@@ -147,6 +171,8 @@ class LabwareMock:
 class ModuleMock:
     """Simulates an Opentrons hardware module (Temperature Module, Thermocycler)."""
 
+    __slots__ = ('module_official_name', 'deck_slot', 'well_colors', 'verbose')
+
     def __init__(
         self,
         module_official_name: str,
@@ -161,28 +187,33 @@ class ModuleMock:
 
     def load_labware(self, labware_official_name: str, display_name: str = "") -> LabwareMock:
         """Load labware onto this module."""
-        _mock_print(f"Module {self.module_official_name} loaded {labware_official_name}",
-                    self.verbose)
+        if self.verbose:
+            _mock_print(f"Module {self.module_official_name} loaded {labware_official_name}")
         return LabwareMock(labware_official_name, self.deck_slot, display_name,
                           self.well_colors, self.verbose)
 
     def set_temperature(self, celsius: int | float) -> None:
         """Set the module temperature."""
         assert isinstance(celsius, (int, float)) and 4 <= celsius <= 110
-        _mock_print(f"Setting temperature to {celsius}°C", self.verbose)
+        if self.verbose:
+            _mock_print(f"Setting temperature to {celsius}°C")
 
     def open_lid(self) -> None:
-        _mock_print("Opening lid", self.verbose)
+        if self.verbose:
+            _mock_print("Opening lid")
 
     def close_lid(self) -> None:
-        _mock_print("Closing lid", self.verbose)
+        if self.verbose:
+            _mock_print("Closing lid")
 
     def set_lid_temperature(self, temperature: int | float) -> None:
         assert isinstance(temperature, (int, float)) and 4 <= temperature <= 110
-        _mock_print(f"Setting lid temperature to {temperature}°C", self.verbose)
+        if self.verbose:
+            _mock_print(f"Setting lid temperature to {temperature}°C")
 
     def deactivate_lid(self) -> None:
-        _mock_print("Deactivate lid", self.verbose)
+        if self.verbose:
+            _mock_print("Deactivate lid")
 
     def set_block_temperature(
         self,
@@ -193,11 +224,12 @@ class ModuleMock:
         block_max_volume: int = 25,
     ) -> None:
         assert isinstance(temperature, (int, float)) and 4 <= temperature <= 110
-        _mock_print(f"Setting block temperature to {temperature}°C", self.verbose)
-        if hold_time_minutes > 0:
-            _mock_print(f"Holding for {hold_time_minutes} minutes...", self.verbose)
-        if hold_time_seconds > 0:
-            _mock_print(f"Holding for {hold_time_seconds} seconds...", self.verbose)
+        if self.verbose:
+            _mock_print(f"Setting block temperature to {temperature}°C")
+            if hold_time_minutes > 0:
+                _mock_print(f"Holding for {hold_time_minutes} minutes...")
+            if hold_time_seconds > 0:
+                _mock_print(f"Holding for {hold_time_seconds} seconds...")
 
     def execute_profile(
         self,
@@ -206,11 +238,13 @@ class ModuleMock:
         block_max_volume: int,
     ) -> None:
         assert isinstance(repetitions, int) and isinstance(block_max_volume, int)
-        _mock_print(f"Executing protocol for {repetitions} cycles", self.verbose)
+        if self.verbose:
+            _mock_print(f"Executing protocol for {repetitions} cycles")
         for step in steps:
             assert isinstance(step, dict)
-            _mock_print(f"  Temperature: {step['temperature']}°C, Time: {step['hold_time_seconds']}s",
-                        self.verbose)
+            if self.verbose:
+                _mock_print(f"  Temperature: {step['temperature']}°C,"
+                            f" Time: {step['hold_time_seconds']}s")
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -224,6 +258,16 @@ class PipetteSim:
     Records positions, volumes, colors, and smear movements.
     """
 
+    __slots__ = (
+        'max_volume', 'instrument_official_name', 'mount_LR', 'tip_rack_list',
+        'well_colors', '_well_ids_upper', 'starting_tip', 'verbose',
+        '_n', '_dx', '_dy', '_dsize', '_dcolor_idx',
+        '_color_index',
+        '_ns', '_smear_segs', '_scolor_idx',
+        'location', 'justDispensedAt', 'current_volume', 'aspirated_loc',
+        '_asp', '_disp', 'curr_color', 'has_tip', 'tip_count',
+    )
+
     def __init__(
         self,
         instrument_official_name: str,
@@ -231,6 +275,7 @@ class PipetteSim:
         tip_rack_list: list[LabwareMock],
         well_colors: dict[str, str],
         verbose: bool = False,
+        color_index: Optional[dict[str, int]] = None,
     ) -> None:
         if instrument_official_name != "p20_single_gen2":
             raise ValueError(
@@ -250,23 +295,34 @@ class PipetteSim:
             )
         self.tip_rack_list = tip_rack_list
         self.well_colors = well_colors
+        self._well_ids_upper = frozenset(wid.upper() for wid in well_colors)
         self.starting_tip: Optional[WellMock] = None
         self.verbose = verbose
 
-        # Droplet tracking state
-        self.droplets_x: list[float] = []
-        self.droplets_y: list[float] = []
-        self.droplets_size: list[float] = []
-        self.droplets_color: list[str] = []
-        self.smears: list[tuple[list[float], list[float], str]] = []
+        # Droplet tracking state — parallel arrays grown by doubling, with each
+        # droplet's raw color name stored as an index into self._color_index
+        self._n: int = 0
+        self._dx = np.empty(_INITIAL_DROPLET_CAPACITY, dtype=np.float64)
+        self._dy = np.empty(_INITIAL_DROPLET_CAPACITY, dtype=np.float64)
+        self._dsize = np.empty(_INITIAL_DROPLET_CAPACITY, dtype=np.float64)
+        self._dcolor_idx = np.empty(_INITIAL_DROPLET_CAPACITY, dtype=np.int16)
+        # Raw color name → palette index; shared with the OpentronsMock that
+        # loaded this pipette, and extended on the fly for unlisted colors
+        self._color_index: dict[str, int] = {} if color_index is None else color_index
+        # Smears share the droplet palette; each is a [[x0, y0], [x1, y1]] segment
+        self._ns: int = 0
+        self._smear_segs = np.empty((_INITIAL_DROPLET_CAPACITY, 2, 2), dtype=np.float64)
+        self._scolor_idx = np.empty(_INITIAL_DROPLET_CAPACITY, dtype=np.int16)
 
         # Pipette state
         self.location: types.Location = _null_location
         self.justDispensedAt: Optional[types.Location] = None
         self.current_volume: float = 0
         self.aspirated_loc: object = None
-        self.totalAspirated: dict[str, float] = {}
-        self.totalDispensed: dict[str, float] = {}
+        # µL aspirated/dispensed per palette index (see totalAspirated/totalDispensed);
+        # plain lists, since a list item += beats both dict and NumPy scalar updates
+        self._asp: list[float] = [0.0] * len(self._color_index)
+        self._disp: list[float] = [0.0] * len(self._color_index)
         self.curr_color: str = 'orange'
         self.has_tip: bool = False
         self.tip_count: int = 0
@@ -282,30 +338,131 @@ class PipetteSim:
     def _get_last_location_by_api_version(self) -> types.Location:
         return self.location
 
+    # ──── Droplet storage ────
+
+    @property
+    def droplets_x(self) -> np.ndarray:
+        """X coordinate of each droplet (mm from center)."""
+        return self._dx[:self._n]
+
+    @property
+    def droplets_y(self) -> np.ndarray:
+        """Y coordinate of each droplet (mm from center)."""
+        return self._dy[:self._n]
+
+    @property
+    def droplets_size(self) -> np.ndarray:
+        """Scatter size of each droplet (volume × 100)."""
+        return self._dsize[:self._n]
+
+    @property
+    def droplets_color(self) -> list[str]:
+        """Matplotlib color of each droplet."""
+        names = self._visual_palette()
+        return [names[i] for i in self._dcolor_idx[:self._n].tolist()]
+
+    @property
+    def smears(self) -> list[tuple[list[float], list[float], str]]:
+        """(x_list, y_list, color) of each smear line."""
+        names = self._visual_palette()
+        return [
+            ([x0, x1], [y0, y1], names[i])
+            for ((x0, y0), (x1, y1)), i in zip(self._smear_segs[:self._ns].tolist(),
+                                               self._scolor_idx[:self._ns].tolist())
+        ]
+
+    @property
+    def totalAspirated(self) -> dict[str, float]:
+        """µL aspirated per raw color name (a new dict on every access)."""
+        return self._volumes_by_color(self._asp)
+
+    @property
+    def totalDispensed(self) -> dict[str, float]:
+        """µL dispensed per raw color name (a new dict on every access)."""
+        return self._volumes_by_color(self._disp)
+
+    def _volumes_by_color(self, volumes: list[float]) -> dict[str, float]:
+        return {color: volumes[i] for color, i in self._color_index.items()
+                if i < len(volumes) and volumes[i]}
+
+    def _color_id(self, color: str) -> int:
+        """Return the palette index for a raw color name, adding it if new."""
+        idx = self._color_index.get(color)
+        if idx is None:
+            idx = self._color_index[color] = len(self._color_index)
+        if idx >= len(self._asp):
+            # The palette grew (here or via another pipette sharing it)
+            pad = [0.0] * (len(self._color_index) - len(self._asp))
+            self._asp += pad
+            self._disp += pad
+        return idx
+
+    def _visual_palette(self) -> list[str]:
+        """Matplotlib color of each palette entry, in index order."""
+        return [resolve_visual_color(color) for color in self._color_index]
+
+    def _grow_droplets(self, min_capacity: int = 0) -> None:
+        """Double the capacity of the droplet arrays (or more, up to min_capacity)."""
+        capacity = max(2 * len(self._dx), min_capacity)
+        self._dx = np.resize(self._dx, capacity)
+        self._dy = np.resize(self._dy, capacity)
+        self._dsize = np.resize(self._dsize, capacity)
+        self._dcolor_idx = np.resize(self._dcolor_idx, capacity)
+
+    def _grow_smears(self) -> None:
+        """Double the capacity of the smear arrays."""
+        capacity = 2 * len(self._smear_segs)
+        self._smear_segs = np.resize(self._smear_segs, (capacity, 2, 2))
+        self._scolor_idx = np.resize(self._scolor_idx, capacity)
+
+    def _has_well_id(self, well_id: str) -> bool:
+        """Case-insensitive membership test against the configured well IDs.
+
+        well_colors can gain keys after construction (a color rolling over to
+        the next row), so the uppercase set is rebuilt once on a miss.
+        """
+        well_id = well_id.upper()
+        if well_id in self._well_ids_upper:
+            return True
+        self._well_ids_upper = frozenset(wid.upper() for wid in self.well_colors)
+        return well_id in self._well_ids_upper
+
     def petriLocOfWell(self, well: WellMock) -> types.Location:
         """Map a Well to a position on the Petri dish diagram."""
-        assert isinstance(well, WellMock)
+        if __debug__ and type(well) is not WellMock:
+            raise TypeError(f"petriLocOfWell() requires a WellMock, got {type(well).__name__}")
         x, y = well.get_row_col()
-        return well.top().move(types.Point(
+        # Same result as well.top().move(...), built as a single Location
+        return types.Location(types.Point(
             x=(x - ord('D')) * MAX_DRAW_RADIUS / 4,
             y=(y - 6) * MAX_DRAW_RADIUS / 6,
             z=0,
-        ))
+        ), 'Well')
 
     def smearIfJustDispensed(self, loc: types.Location | WellMock) -> None:
         """Draw a smear if the pipette moves immediately after dispensing."""
-        assert isinstance(loc, (types.Location, WellMock))
-        if self.justDispensedAt is not None:
-            newloc = loc if isinstance(loc, types.Location) else self.petriLocOfWell(loc)
-            if not _same_2d_location(self.justDispensedAt, newloc):
-                line_end = self.justDispensedAt.move(
-                    0.5 * (newloc.point - self.justDispensedAt.point)
-                )
-                self.smears.append((
-                    [self.justDispensedAt.point.x, line_end.point.x],
-                    [self.justDispensedAt.point.y, line_end.point.y],
-                    resolve_visual_color(self.curr_color),
-                ))
+        is_location = type(loc) is types.Location
+        if __debug__ and not is_location and type(loc) is not WellMock:
+            raise TypeError(
+                f"Expected a types.Location or WellMock, got {type(loc).__name__}"
+            )
+        jd = self.justDispensedAt
+        if jd is not None:
+            newloc = loc if is_location else self.petriLocOfWell(loc)
+            x0 = jd.point.x
+            y0 = jd.point.y
+            x1 = newloc.point.x
+            y1 = newloc.point.y
+            # Moving in Z only (same X, Y, and labware) does not smear
+            if x1 != x0 or y1 != y0 or newloc.labware != jd.labware:
+                # Smear runs halfway towards the new location; plain floats,
+                # no intermediate Point/Location objects
+                ns = self._ns
+                if ns == len(self._smear_segs):
+                    self._grow_smears()
+                self._smear_segs[ns] = ((x0, y0), (x0 + 0.5 * (x1 - x0), y0 + 0.5 * (y1 - y0)))
+                self._scolor_idx[ns] = self._color_id(self.curr_color)
+                self._ns = ns + 1
         self.justDispensedAt = None
 
     # ──── Opentrons API methods ────
@@ -320,18 +477,23 @@ class PipetteSim:
             location: Target location (must be a types.Location, not a Well).
 
         Raises:
-            AssertionError: If location is not a types.Location.
+            TypeError: If location is not a types.Location or volume is not a
+                       number (checked unless running with ``python -O``).
             RuntimeError: If no tip is attached.
             ValueError: If volume exceeds current volume, is non-positive,
                         or target is outside the safe draw area.
         """
-        assert isinstance(location, types.Location), \
-            "dispense() requires a types.Location — not a Well or TrashBin"
-        assert isinstance(volume, (int, float))
-
-        if location.point.x ** 2 + location.point.y ** 2 > MAX_DRAW_RADIUS ** 2:
+        if __debug__:
+            if type(location) is not types.Location:
+                raise TypeError("dispense() requires a types.Location — not a Well or TrashBin")
+            if type(volume) not in _NUMBER and not isinstance(volume, _NUMBER):
+                raise TypeError(f"dispense() volume must be a number, got {type(volume).__name__}")
+
+        x = location.point.x
+        y = location.point.y
+        if x * x + y * y > _MAX_DRAW_R2:
             raise ValueError(
-                f'Dispensing outside safe area: ({location.point.x}, {location.point.y})'
+                f'Dispensing outside safe area: ({x}, {y})'
                 f' is more than {MAX_DRAW_RADIUS}mm from center.'
             )
         if not self.has_tip:
@@ -350,17 +512,85 @@ class PipetteSim:
         self.smearIfJustDispensed(location)
         self.current_volume -= volume
 
-        visual = resolve_visual_color(self.curr_color)
-        self.droplets_x.append(location.point.x)
-        self.droplets_y.append(location.point.y)
-        self.droplets_size.append(volume * 100)  # scale factor: 1µL → 100 sq.pt
-        self.droplets_color.append(visual)
-
-        self.totalDispensed.setdefault(self.curr_color, 0)
-        self.totalDispensed[self.curr_color] += volume
+        n = self._n
+        if n == len(self._dx):
+            self._grow_droplets()
+        color_idx = self._color_id(self.curr_color)
+        self._dx[n] = x
+        self._dy[n] = y
+        self._dsize[n] = volume * 100  # scale factor: 1µL → 100 sq.pt
+        self._dcolor_idx[n] = color_idx
+        self._n = n + 1
+
+        self._disp[color_idx] += volume
         self.location = location
         self.justDispensedAt = location
 
+    def dispense_many(self, volumes: float | ArrayLike, xs: ArrayLike, ys: ArrayLike) -> None:
+        """Dispense a batch of droplets at z=0 in one vectorized call.
+
+        Same result as ``dispense()`` at each (x, y) with a vertical jog in
+        between, as ``dispense_and_jog`` does: no smears are drawn between the
+        droplets, and the pipette ends up above the last one.
+
+        Args:
+            volumes: Volume in µL of each droplet, or one volume for all.
+            xs: X coordinate of each droplet (mm from center).
+            ys: Y coordinate of each droplet (mm from center).
+
+        Raises:
+            RuntimeError: If no tip is attached.
+            ValueError: If xs and ys differ in shape, the total exceeds the
+                        current volume, any volume is non-positive, or any
+                        target is outside the safe draw area.
+        """
+        xs = np.asarray(xs, dtype=np.float64).ravel()
+        ys = np.asarray(ys, dtype=np.float64).ravel()
+        if xs.shape != ys.shape:
+            raise ValueError(f"xs and ys differ in length: {len(xs)} vs {len(ys)}")
+        volumes = np.broadcast_to(np.asarray(volumes, dtype=np.float64), xs.shape)
+        k = len(xs)
+        if k == 0:
+            return
+
+        outside = np.flatnonzero(xs * xs + ys * ys > _MAX_DRAW_R2)
+        if len(outside):
+            i = outside[0]
+            raise ValueError(
+                f'Dispensing outside safe area: ({xs[i]}, {ys[i]})'
+                f' is more than {MAX_DRAW_RADIUS}mm from center.'
+            )
+        if not self.has_tip:
+            raise RuntimeError("dispense_many() called without a tip")
+        total = float(volumes.sum())
+        if self.current_volume < total:
+            raise ValueError(
+                f"Dispensing {total}µL but only {self.current_volume}µL in pipette."
+            )
+        if (volumes <= 0).any():
+            raise ValueError(
+                f"Dispense volume must be positive, got: {volumes.min()}µL"
+            )
+
+        if self.justDispensedAt is not None:
+            self.smearIfJustDispensed(types.Location(
+                types.Point(xs[0], ys[0], 0), self.justDispensedAt.labware
+            ))
+        self.current_volume -= total
+
+        n = self._n
+        if n + k > len(self._dx):
+            self._grow_droplets(n + k)
+        self._dx[n:n + k] = xs
+        self._dy[n:n + k] = ys
+        self._dsize[n:n + k] = volumes * 100  # scale factor: 1µL → 100 sq.pt
+        color_idx = self._color_id(self.curr_color)
+        self._dcolor_idx[n:n + k] = color_idx
+        self._n = n + k
+
+        self._disp[color_idx] += total
+        self.location = types.Location(types.Point(xs[-1], ys[-1], 0), None)
+
     def aspirate(self, volume: float, location: types.Location | WellMock) -> None:
         """Aspirate liquid from the given location.
 
@@ -369,11 +599,18 @@ class PipetteSim:
             location: Source location (Well or types.Location).
 
         Raises:
+            TypeError: If volume is not a number or location is neither a Well
+                       nor a types.Location (checked unless running with ``python -O``).
             RuntimeError: If no tip is attached or cross-contamination detected.
             ValueError: If volume would exceed max pipette capacity.
         """
-        assert isinstance(volume, (int, float))
-        assert isinstance(location, (types.Location, WellMock))
+        if __debug__:
+            if type(volume) not in _NUMBER and not isinstance(volume, _NUMBER):
+                raise TypeError(f"aspirate() volume must be a number, got {type(volume).__name__}")
+            if type(location) is not types.Location and type(location) is not WellMock:
+                raise TypeError(
+                    f"aspirate() requires a Well or types.Location, got {type(location).__name__}"
+                )
 
         if not self.has_tip:
             raise RuntimeError("aspirate() called without a tip")
@@ -394,7 +631,8 @@ class PipetteSim:
         self.current_volume += volume
 
         if isinstance(location, WellMock):
-            if location.well_id.upper() not in (wid.upper() for wid in self.well_colors.keys()):
+            if location.well_id not in self.well_colors \
+                    and not self._has_well_id(location.well_id):
                 raise ValueError(
                     f"aspirate() on well {location} which has no configured color."
                 )
@@ -408,8 +646,7 @@ class PipetteSim:
             newloc = location  # already a types.Location, use as-is
 
         self.curr_color = color
-        self.totalAspirated.setdefault(color, 0)
-        self.totalAspirated[color] += volume
+        self._asp[self._color_id(color)] += volume
         self.location = newloc
 
     def pick_up_tip(self) -> None:
@@ -461,40 +698,62 @@ class PipetteSim:
     def blow_out(self, location: object = None) -> None:
         """Blow out remaining liquid (visual no-op)."""
         self.current_volume = 0
-        _mock_print("Blow out", self.verbose)
+        if self.verbose:
+            _mock_print("Blow out")
 
     def touch_tip(self, **kwargs: object) -> None:
         """Touch the tip against well walls (visual no-op)."""
-        _mock_print("Touch tip", self.verbose)
+        if self.verbose:
+            _mock_print("Touch tip")
 
     def mix(self, repetitions: int = 1, volume: Optional[float] = None,
             location: object = None) -> None:
         """Mix by aspirating and dispensing (visual no-op)."""
-        _mock_print(f"Mix {repetitions}x", self.verbose)
+        if self.verbose:
+            _mock_print(f"Mix {repetitions}x")
 
     # ──── Visualization ────
 
-    def visualize(self, **kwargs: object) -> tuple:
+    def visualize(self, headless: bool = False, **kwargs: object) -> tuple:
         """Generate the Petri dish visualization with all recorded droplets.
 
-        Delegates to visualization.visualize_petri() with all accumulated data.
+        Delegates to visualization.visualize_petri() with all accumulated data,
+        or to visualize_petri_headless() if ``headless`` is True.
 
         Keyword Args:
+            headless: Render without pyplot (save-only; ``show`` is ignored).
             background: 'black' (dark agar), 'agar' (beige), or 'paper' (outline).
             title: Plot title string.
             save_path: File path to save the image.
             show: Whether to display the plot.
             dpi: Image resolution for saving.
+            print_summary: Whether to print the volume and tip summary.
+            ax: Existing Axes to draw into (not with ``headless``).
 
         Returns:
             Tuple of (Figure, Axes).
         """
-        return visualize_petri(
+        if headless:
+            kwargs.pop('show', None)
+            render = visualize_petri_headless
+        else:
+            render = visualize_petri
+        # Convert only the palette entries something was drawn with: deck colors
+        # that were never dispensed need not be valid matplotlib colors
+        n = self._n
+        used, remap = np.unique(
+            np.concatenate((self._dcolor_idx[:n], self._scolor_idx[:self._ns])),
+            return_inverse=True,
+        )
+        names = self._visual_palette()
+        colors = rgba_table([names[i] for i in used.tolist()])[remap]
+        return render(
             droplets_x=self.droplets_x,
             droplets_y=self.droplets_y,
             droplets_size=self.droplets_size,
-            droplets_color=self.droplets_color,
-            smears=self.smears,
+            droplets_color=colors[:n],
+            smears=self._smear_segs[:self._ns],
+            smear_colors=colors[n:],
             total_aspirated=self.totalAspirated,
             total_dispensed=self.totalDispensed,
             tip_count=self.tip_count,
@@ -533,21 +792,29 @@ class OpentronsMock:
         self.verbose = verbose
         self.well_colors = well_colors or {}
         self.pipette: Optional[PipetteSim] = None
+        # Color palette known up front: every deck color plus the pipette's
+        # defaults (initial, Location aspirate, empty well). Droplets store
+        # indices into it; RGBA values are only computed when rendering
+        palette = sorted(set(self.well_colors.values()) | {'orange', 'white', 'purple'})
+        self._color_index: dict[str, int] = {c: i for i, c in enumerate(palette)}
 
     def home(self) -> None:
         """Simulate homing the robot."""
-        _mock_print("Going home!", self.verbose)
+        if self.verbose:
+            _mock_print("Going home!")
 
     def load_labware(self, labware_official_name: str, deck_slot: int,
                      display_name: str = "") -> LabwareMock:
         """Load labware onto the deck."""
-        _mock_print(f"Loaded {labware_official_name} in slot {deck_slot}", self.verbose)
+        if self.verbose:
+            _mock_print(f"Loaded {labware_official_name} in slot {deck_slot}")
         return LabwareMock(labware_official_name, deck_slot, display_name,
                           self.well_colors, self.verbose)
 
     def load_module(self, module_official_name: str, deck_slot: int = 0) -> ModuleMock:
         """Load a hardware module onto the deck."""
-        _mock_print(f"Loaded module {module_official_name} in slot {deck_slot}", self.verbose)
+        if self.verbose:
+            _mock_print(f"Loaded module {module_official_name} in slot {deck_slot}")
         return ModuleMock(module_official_name, deck_slot, self.well_colors, self.verbose)
 
     def load_instrument(self, instrument_official_name: str, mount_LR: str,
@@ -555,21 +822,24 @@ class OpentronsMock:
         """Load a pipette instrument."""
         self.pipette = PipetteSim(
             instrument_official_name, mount_LR, tip_rack_list, self.well_colors,
-            self.verbose,
+            self.verbose, self._color_index,
         )
         return self.pipette
 
     def pause(self, msg: str = "") -> None:
         """Simulate a robot pause."""
-        _mock_print(f"Robot pause: {msg}", self.verbose)
+        if self.verbose:
+            _mock_print(f"Robot pause: {msg}")
 
     def comment(self, msg: str = "") -> None:
         """Add a protocol comment."""
-        _mock_print(f"Comment: {msg}", self.verbose)
+        if self.verbose:
+            _mock_print(f"Comment: {msg}")
 
     def delay(self, seconds: float = 0, minutes: float = 0, msg: str = "") -> None:
         """Simulate a delay."""
-        _mock_print(f"Delay: {minutes}m {seconds}s — {msg}", self.verbose)
+        if self.verbose:
+            _mock_print(f"Delay: {minutes}m {seconds}s — {msg}")
 
     def visualize(self, **kwargs: object) -> Optional[tuple]:
         """Generate the Petri dish visualization.
@@ -590,6 +860,38 @@ class OpentronsMock:
 # Convenience function
 # ═══════════════════════════════════════════════════════════════════════
 
+# Absolute path → (mtime_ns, compiled code) of protocols already loaded
+_protocol_code_cache: dict[str, tuple[int, CodeType]] = {}
+
+
+def _load_protocol(protocol_file_path: str) -> ModuleType:
+    """Execute a protocol file into a fresh module, compiling it at most once.
+
+    Only the code object is cached: the module itself is rebuilt on every call,
+    since running a protocol may mutate its globals (e.g. ``well_colors`` when a
+    color moves to the next well). Editing the file invalidates the cache.
+
+    Compilation goes through ``SourceFileLoader``, so the bytecode is also kept
+    in ``__pycache__`` like a regular import and later CLI runs skip compiling.
+    """
+    import os
+    from importlib.machinery import SourceFileLoader
+
+    path = os.path.abspath(protocol_file_path)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _protocol_code_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        code = cached[1]
+    else:
+        code = SourceFileLoader("protocol_module", path).get_code("protocol_module")
+        _protocol_code_cache[path] = (mtime, code)
+
+    mod = ModuleType("protocol_module")
+    mod.__file__ = path
+    exec(code, mod.__dict__)
+    return mod
+
+
 def simulate_protocol(
     protocol_file_path: str,
     well_colors: Optional[dict[str, str]] = None,
@@ -599,6 +901,7 @@ def simulate_protocol(
     show: bool = True,
     dpi: int = 150,
     verbose: bool = False,
+    headless: bool = False,
 ) -> OpentronsMock:
     """Load and run an Opentrons protocol file in simulation mode.
 
@@ -617,6 +920,8 @@ def simulate_protocol(
         show: Whether to display the plot window.
         dpi: Resolution for saved images.
         verbose: If True, print debug messages for each operation.
+        headless: If True, render without pyplot or a GUI backend (for saving
+                  only); ``show`` is ignored.
 
     Returns:
         The OpentronsMock instance used (for further inspection).
@@ -625,15 +930,12 @@ def simulate_protocol(
         FileNotFoundError: If the protocol file does not exist.
         AttributeError: If the protocol file has no ``run()`` function.
     """
-    import importlib.util
     import os
 
     if not os.path.exists(protocol_file_path):
         raise FileNotFoundError(f"Protocol file not found: {protocol_file_path}")
 
-    spec = importlib.util.spec_from_file_location("protocol_module", protocol_file_path)
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
+    mod = _load_protocol(protocol_file_path)
 
     if not hasattr(mod, 'run'):
         raise AttributeError(
@@ -652,5 +954,6 @@ def simulate_protocol(
         save_path=save_path,
         show=show,
         dpi=dpi,
+        headless=headless,
     )
     return mock
@@ -2,34 +2,56 @@
 visualization.py — Petri dish visualization for Opentrons Bio-Art protocols
 ============================================================================
 Renders droplet positions, smears, and volume summaries as a matplotlib figure.
+
+matplotlib is imported on first render rather than at import time, so
+simulating without drawing never pays for it. ``visualize_petri_headless``
+skips pyplot entirely for save-only rendering.
 """
 
 from __future__ import annotations
 
-from typing import Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Sequence
 
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-from matplotlib.axes import Axes
+import numpy as np
+from numpy.typing import ArrayLike
 
 from .colors import PETRI_INNER_DIAMETER
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
+    from matplotlib.path import Path
+
+
+def rgba_table(colors: Sequence[str]) -> np.ndarray:
+    """Convert matplotlib color names to an (N, 4) float RGBA array."""
+    from matplotlib.colors import to_rgba_array
+
+    if not colors:
+        return np.empty((0, 4))
+    return to_rgba_array(colors)
+
 
 def visualize_petri(
-    droplets_x: list[float],
-    droplets_y: list[float],
-    droplets_size: list[float],
-    droplets_color: list[str],
-    smears: list[tuple[list[float], list[float], str]],
+    droplets_x: ArrayLike,
+    droplets_y: ArrayLike,
+    droplets_size: ArrayLike,
+    droplets_color: ArrayLike,
+    smears: list[tuple[list[float], list[float], str]] | np.ndarray,
     total_aspirated: dict[str, float],
     total_dispensed: dict[str, float],
     tip_count: int,
+    smear_colors: Optional[ArrayLike] = None,
     background: str = 'black',
     title: str = 'Opentrons Bio-Art Simulation',
     save_path: Optional[str] = None,
     show: bool = True,
     dpi: int = 150,
     figsize: tuple[float, float] = (10, 10),
+    print_summary: bool = True,
+    ax: Optional[Axes] = None,
 ) -> tuple[Figure, Axes]:
     """Render a Petri dish visualization with all dispensed droplets.
 
@@ -37,63 +59,190 @@ def visualize_petri(
         droplets_x: X coordinates of each droplet (mm from center).
         droplets_y: Y coordinates of each droplet (mm from center).
         droplets_size: Size of each droplet in scatter points (volume × 100).
-        droplets_color: Matplotlib color of each droplet.
-        smears: List of (x_list, y_list, color) tuples for smear lines.
+        droplets_color: Matplotlib color of each droplet, or an (N, 4) RGBA array.
+        smears: List of (x_list, y_list, color) tuples for smear lines, or an
+                (N, 2, 2) array of [[x0, y0], [x1, y1]] segments when
+                ``smear_colors`` is given.
         total_aspirated: Dict mapping color name → total µL aspirated.
         total_dispensed: Dict mapping color name → total µL dispensed.
         tip_count: Number of tips used during the protocol.
+        smear_colors: Color of each segment in ``smears`` (names or an (N, 4)
+                      RGBA array). Leave as None for the tuple form.
         background: 'black' (dark agar), 'agar' (beige agar), or 'paper' (outline only).
         title: Plot title.
         save_path: If provided, save figure to this file path.
         show: If True, call plt.show(). Set False for headless/test usage.
         dpi: Resolution for saved images.
         figsize: Figure size in inches.
+        print_summary: If True, print the per-color volume and tip summary.
+                       Set False for batch rendering.
+        ax: Existing Axes to draw into (e.g. a subplot, or one reused across
+            renders after ``ax.clear()``). ``figsize`` is ignored when given.
+
+    Returns:
+        Tuple of (Figure, Axes) for further customization.
+    """
+    import matplotlib.pyplot as plt
+
+    if print_summary:
+        _print_volume_summary(total_aspirated, total_dispensed, tip_count)
+    if ax is None:
+        fig, ax = plt.subplots(figsize=figsize)
+    else:
+        fig = ax.figure
+    _draw_petri(ax, _build_petri_scene(droplets_x, droplets_y, droplets_size, droplets_color,
+                                       smears, smear_colors, background, title))
+    _save_figure(fig, save_path, dpi)
+    if show:
+        plt.show()
+    return fig, ax
+
+
+def visualize_petri_headless(
+    droplets_x: ArrayLike,
+    droplets_y: ArrayLike,
+    droplets_size: ArrayLike,
+    droplets_color: ArrayLike,
+    smears: list[tuple[list[float], list[float], str]] | np.ndarray,
+    total_aspirated: dict[str, float],
+    total_dispensed: dict[str, float],
+    tip_count: int,
+    smear_colors: Optional[ArrayLike] = None,
+    background: str = 'black',
+    title: str = 'Opentrons Bio-Art Simulation',
+    save_path: Optional[str] = None,
+    dpi: int = 150,
+    figsize: tuple[float, float] = (10, 10),
+    print_summary: bool = True,
+) -> tuple[Figure, Axes]:
+    """Render the Petri dish without pyplot, for saving images only.
+
+    Takes the same arguments as :func:`visualize_petri` minus ``show``. The
+    figure is a bare ``matplotlib.figure.Figure``: no GUI backend is loaded and
+    pyplot does not keep a reference to it, so nothing needs closing afterwards.
 
     Returns:
         Tuple of (Figure, Axes) for further customization.
     """
-    # ── Print volume summary ──
-    _print_volume_summary(total_aspirated, total_dispensed, tip_count)
+    from matplotlib.figure import Figure
+
+    if print_summary:
+        _print_volume_summary(total_aspirated, total_dispensed, tip_count)
+    fig = Figure(figsize=figsize)
+    ax = fig.subplots()
+    _draw_petri(ax, _build_petri_scene(droplets_x, droplets_y, droplets_size, droplets_color,
+                                       smears, smear_colors, background, title))
+    _save_figure(fig, save_path, dpi)
+    return fig, ax
+
+
+@lru_cache(maxsize=None)
+def _droplet_marker_path() -> Path:
+    """Circle marker path used by scatter() (diameter = sqrt(size) points)."""
+    from matplotlib.markers import MarkerStyle
+
+    marker = MarkerStyle('o')
+    return marker.get_path().transformed(marker.get_transform())
+
+
+# Background name → (dish color, filled); unknown names fall back to 'black'
+_BACKGROUNDS: dict[str, tuple[str, bool]] = {
+    'black': ('#000000', True),
+    'agar':  ('#d7ca95', True),
+    'paper': ('#000000', False),
+}
+
+
+@dataclass
+class _PetriScene:
+    """What goes on the dish, as plain data with no matplotlib objects."""
+
+    radius: float
+    dish_color: str
+    dish_fill: bool
+    droplet_offsets: np.ndarray  # (N, 2) x/y in mm
+    droplet_sizes: np.ndarray    # (N,) scatter sizes in sq.pt
+    droplet_colors: ArrayLike    # N color names or an (N, 4) RGBA array
+    smear_segments: ArrayLike    # [[x0, y0], [x1, y1], ...] per smear
+    smear_colors: ArrayLike      # one color per smear
+    title: str
 
-    # ── Create figure ──
-    fig, ax = plt.subplots(figsize=figsize)
+
+def _build_petri_scene(
+    droplets_x: ArrayLike,
+    droplets_y: ArrayLike,
+    droplets_size: ArrayLike,
+    droplets_color: ArrayLike,
+    smears: list[tuple[list[float], list[float], str]] | np.ndarray,
+    smear_colors: Optional[ArrayLike],
+    background: str,
+    title: str,
+) -> _PetriScene:
+    """Normalise the inputs of :func:`visualize_petri` into a :class:`_PetriScene`."""
+    dish_color, dish_fill = _BACKGROUNDS.get(background, _BACKGROUNDS['black'])
+    if smear_colors is None:
+        smear_colors = [scolor for _, _, scolor in smears]
+        smears = [list(zip(xlist, ylist)) for xlist, ylist, _ in smears]
+    return _PetriScene(
+        radius=PETRI_INNER_DIAMETER / 2,
+        dish_color=dish_color,
+        dish_fill=dish_fill,
+        droplet_offsets=np.column_stack((droplets_x, droplets_y)),
+        droplet_sizes=np.asarray(droplets_size, dtype=np.float64),
+        droplet_colors=droplets_color,
+        smear_segments=smears,
+        smear_colors=smear_colors,
+        title=title,
+    )
+
+
+def _draw_petri(ax: Axes, scene: _PetriScene) -> None:
+    """Draw the dish, droplets, and smears of ``scene`` onto ``ax``."""
+    from matplotlib.collections import LineCollection, PathCollection
+    from matplotlib.colors import to_rgba_array
+    from matplotlib.patches import Circle
+    from matplotlib.transforms import IdentityTransform
 
     # ── Petri dish background ──
-    radius = PETRI_INNER_DIAMETER / 2
-    bg_colors = {
-        'black': ('#000000', True),
-        'agar':  ('#d7ca95', True),
-        'paper': ('#000000', False),
-    }
-    color, fill = bg_colors.get(background, bg_colors['black'])
-    ax.add_patch(plt.Circle((0, 0), radius=radius, color=color, fill=fill))
-
-    # ── Droplets ──
-    if droplets_x:
-        ax.scatter(droplets_x, droplets_y, droplets_size, c=droplets_color)
-
-    # ── Smears ──
-    for xlist, ylist, scolor in smears:
-        ax.plot(xlist, ylist, color=scolor, linewidth=4, solid_capstyle='round')
+    ax.add_patch(Circle((0, 0), radius=scene.radius, color=scene.dish_color,
+                        fill=scene.dish_fill))
+
+    # ── Droplets (the PathCollection scatter() would build, minus its
+    #    per-point color and argument parsing) ──
+    if len(scene.droplet_sizes):
+        colors = np.asarray(scene.droplet_colors)
+        if colors.ndim != 2:
+            colors = to_rgba_array(scene.droplet_colors)
+        ax.add_collection(PathCollection(
+            (_droplet_marker_path(),),
+            scene.droplet_sizes,
+            offsets=scene.droplet_offsets,
+            offset_transform=ax.transData,
+            transform=IdentityTransform(),
+            facecolors=colors,
+            edgecolors='face',
+        ))
+
+    # ── Smears (one LineCollection instead of a plot() call per smear) ──
+    if len(scene.smear_segments):
+        ax.add_collection(LineCollection(scene.smear_segments, colors=scene.smear_colors,
+                                         linewidths=4, capstyle='round'))
 
     # ── Axes setup ──
-    margin = radius + 0.5
+    margin = scene.radius + 0.5
     ax.set_xlim(-margin, margin)
     ax.set_ylim(-margin, margin)
     ax.set_aspect('equal')
-    ax.set_title(title)
+    ax.set_title(scene.title)
+
 
-    # ── Save / Show ──
+def _save_figure(fig: Figure, save_path: Optional[str], dpi: int) -> None:
+    """Save ``fig`` to ``save_path`` if one was given."""
     if save_path:
         fig.savefig(save_path, dpi=dpi, bbox_inches='tight',
                     facecolor=fig.get_facecolor(), edgecolor='none')
         print(f"\nImage saved to: {save_path}")
 
-    if show:
-        plt.show()
-
-    return fig, ax
-
 
 def _print_volume_summary(
     total_aspirated: dict[str, float],
@@ -0,0 +1,41 @@
+"""Shared fixtures for the test suite."""
+
+import os
+
+import pytest
+
+
+EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', 'examples')
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures')
+OCTOCAT_PATH = os.path.join(EXAMPLES_DIR, 'octocat.py')
+
+
+@pytest.fixture(scope='session')
+def tiny_protocol_path():
+    """Path to a two-droplet protocol, for tests that don't care about the drawing."""
+    return os.path.join(FIXTURES_DIR, 'tiny_protocol.py')
+
+
+@pytest.fixture(scope='session')
+def octocat_mock():
+    """The octocat example, run through simulate_protocol once per test session.
+
+    Treat it as read-only: tests share the same OpentronsMock instance.
+    """
+    from opentrons_bioart_sim import simulate_protocol
+
+    return simulate_protocol(OCTOCAT_PATH, show=False, headless=True)
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip every test that needs the octocat example when it is missing.
+
+    Checked once at collection time, so those tests are reported as skipped
+    without running fixture setup.
+    """
+    if os.path.exists(OCTOCAT_PATH):
+        return
+    skip = pytest.mark.skip(reason="octocat.py example not found")
+    for item in items:
+        if 'octocat_mock' in getattr(item, 'fixturenames', ()):
+            item.add_marker(skip)
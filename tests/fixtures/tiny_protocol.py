@@ -0,0 +1,21 @@
+"""Minimal two-droplet protocol for tests that only need *a* simulation."""
+
+from opentrons import types
+
+metadata = {'protocolName': 'tiny test protocol', 'apiLevel': '2.20'}
+
+well_colors = {'A1': 'sfGFP'}
+
+
+def run(protocol):
+    tips = protocol.load_labware('opentrons_96_tiprack_20ul', 9)
+    pipette = protocol.load_instrument('p20_single_gen2', 'right', [tips])
+    plate = protocol.load_labware('nest_96_wellplate_2ml_deep', 6)
+    agar = protocol.load_labware('htgaa_agar_plate', 5)
+    center = agar['A1'].top()
+
+    pipette.pick_up_tip()
+    for x in (-5, 5):
+        pipette.aspirate(1, plate['A1'])
+        pipette.dispense(1, center.move(types.Point(x, 0, 0)))
+    pipette.drop_tip()
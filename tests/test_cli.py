@@ -1,21 +1,27 @@
 """Tests for the CLI entry point."""
 
-import os
-import tempfile
+import subprocess
+import sys
 
 import pytest
 
-from opentrons_bioart_sim.cli import main
+from opentrons_bioart_sim import mock as mock_module
+from opentrons_bioart_sim.cli import build_parser, main, run
 
 
-EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', 'examples')
+@pytest.fixture
+def simulate_calls(monkeypatch):
+    """Record the keyword arguments main() passes to simulate_protocol."""
+    calls = []
+    monkeypatch.setattr(mock_module, 'simulate_protocol', lambda **kwargs: calls.append(kwargs))
+    return calls
 
 
 class TestCLI:
     def test_help_flag(self, capsys):
         """--help should print usage and exit 0."""
         with pytest.raises(SystemExit) as exc:
-            main(['--help'])
+            build_parser().parse_args(['--help'])
         assert exc.value.code == 0
         captured = capsys.readouterr()
         assert 'opentrons-bioart-sim' in captured.out
@@ -23,7 +29,7 @@ class TestCLI:
     def test_version_flag(self, capsys):
         """--version should print version and exit 0."""
         with pytest.raises(SystemExit) as exc:
-            main(['--version'])
+            build_parser().parse_args(['--version'])
         assert exc.value.code == 0
         captured = capsys.readouterr()
         assert '1.0.0' in captured.out
@@ -31,53 +37,96 @@ class TestCLI:
     def test_missing_protocol_arg(self):
         """No args should exit with error code 2."""
         with pytest.raises(SystemExit) as exc:
-            main([])
+            build_parser().parse_args([])
         assert exc.value.code == 2
 
-    def test_nonexistent_file_exits_1(self):
-        """Non-existent file should exit with code 1."""
+    def test_defaults(self):
+        args = build_parser().parse_args(['design.py'])
+        assert args.protocol == 'design.py'
+        assert args.background == 'black'
+        assert args.save is None
+        assert args.dpi == 150
+        assert not args.no_show and not args.verbose
+
+    def test_nonexistent_file_returns_1(self, capsys):
+        """Non-existent file should give exit code 1."""
+        args = build_parser().parse_args(['nonexistent_protocol.py', '--no-show'])
+        assert run(args) == 1
+        assert 'File not found' in capsys.readouterr().err
+
+    def test_main_exits_with_run_status(self):
         with pytest.raises(SystemExit) as exc:
             main(['nonexistent_protocol.py'])
         assert exc.value.code == 1
 
-    def test_run_example_no_show(self):
-        """Run an example protocol via CLI with --no-show."""
-        protocol_path = os.path.join(EXAMPLES_DIR, 'octocat.py')
-        if not os.path.exists(protocol_path):
-            pytest.skip("octocat.py example not found")
-
-        # Should complete without raising
-        main([protocol_path, '--no-show'])
-
-    def test_save_flag_creates_file(self):
-        """--save should create an output image file."""
-        protocol_path = os.path.join(EXAMPLES_DIR, 'octocat.py')
-        if not os.path.exists(protocol_path):
-            pytest.skip("octocat.py example not found")
-
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as f:
-            save_path = f.name
-
-        try:
-            main([protocol_path, '--no-show', '--save', save_path])
-            assert os.path.exists(save_path)
-            assert os.path.getsize(save_path) > 0
-        finally:
-            if os.path.exists(save_path):
-                os.unlink(save_path)
-
-    def test_background_agar(self):
-        """--background agar should work."""
-        protocol_path = os.path.join(EXAMPLES_DIR, 'octocat.py')
-        if not os.path.exists(protocol_path):
-            pytest.skip("octocat.py example not found")
-
-        main([protocol_path, '--no-show', '--background', 'agar'])
-
-    def test_verbose_flag(self):
-        """--verbose should run without error."""
-        protocol_path = os.path.join(EXAMPLES_DIR, 'octocat.py')
-        if not os.path.exists(protocol_path):
-            pytest.skip("octocat.py example not found")
-
-        main([protocol_path, '--no-show', '--verbose'])
+    def test_run_example_no_show(self, simulate_calls):
+        """--no-show should render headless and not open a window."""
+        main(['octocat.py', '--no-show'])
+        assert simulate_calls == [dict(
+            protocol_file_path='octocat.py', background='black', save_path=None,
+            title='Opentrons Bio-Art Simulation', show=False, dpi=150,
+            verbose=False, headless=True,
+        )]
+
+    def test_save_flag_creates_file(self, tiny_protocol_path, tmp_path):
+        """--save should produce an output image."""
+        save_path = tmp_path / 'out.png'
+        main([tiny_protocol_path, '--no-show', '--save', str(save_path)])
+        assert save_path.stat().st_size > 0
+
+    def test_background_agar(self, tiny_protocol_path, capsys):
+        """--background agar should run and be reported."""
+        main([tiny_protocol_path, '--no-show', '--background', 'agar'])
+        assert 'Petri dish background: agar' in capsys.readouterr().out
+
+    def test_verbose_flag(self, tiny_protocol_path, capsys):
+        """--verbose should log each protocol step."""
+        main([tiny_protocol_path, '--no-show', '--verbose'])
+        assert 'Loaded htgaa_agar_plate in slot 5' in capsys.readouterr().out
+
+    def test_protocol_error_returns_1(self, monkeypatch, capsys):
+        def fail(**kwargs):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(mock_module, 'simulate_protocol', fail)
+        assert run(build_parser().parse_args(['octocat.py'])) == 1
+        assert 'boom' in capsys.readouterr().err
+
+
+class TestLazyImports:
+    def test_package_import_defers_mock(self):
+        """Importing the package must not pull in opentrons or matplotlib."""
+        code = (
+            "import sys, opentrons_bioart_sim; "
+            "assert 'opentrons_bioart_sim.mock' not in sys.modules; "
+            "assert 'matplotlib' not in sys.modules"
+        )
+        subprocess.run([sys.executable, '-c', code], check=True)
+
+    def test_cli_import_budget(self):
+        """--help/--version must not load the simulator's heavy dependencies."""
+        code = (
+            "import sys\n"
+            "from opentrons_bioart_sim import cli\n"
+            "try:\n"
+            "    cli.main(['--version'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "heavy = ['matplotlib', 'numpy', 'opentrons', 'opentrons_bioart_sim.mock']\n"
+            "loaded = [m for m in heavy if m in sys.modules]\n"
+            "assert not loaded, loaded\n"
+        )
+        subprocess.run([sys.executable, '-c', code], check=True, capture_output=True)
+
+    def test_lazy_exports_resolve(self):
+        import opentrons_bioart_sim
+        from opentrons_bioart_sim.mock import OpentronsMock, simulate_protocol
+
+        assert opentrons_bioart_sim.OpentronsMock is OpentronsMock
+        assert opentrons_bioart_sim.simulate_protocol is simulate_protocol
+
+    def test_unknown_attribute_raises(self):
+        import opentrons_bioart_sim
+
+        with pytest.raises(AttributeError):
+            opentrons_bioart_sim.not_a_real_export
@@ -1,5 +1,9 @@
 """Tests for color resolution and protein mapping."""
 
+import dis
+
+import pytest
+
 from opentrons_bioart_sim.colors import (
     PROTEIN_VISUAL_COLORS,
     resolve_visual_color,
@@ -24,34 +28,50 @@ class TestProteinColorMapping:
     def test_azurite_is_royalblue(self):
         assert PROTEIN_VISUAL_COLORS['azurite'] == 'royalblue'
 
+    def test_keys_are_canonical_lowercase(self):
+        assert all(key == key.lower().strip() for key in PROTEIN_VISUAL_COLORS)
+
+    def test_mapping_is_read_only(self):
+        with pytest.raises(TypeError):
+            PROTEIN_VISUAL_COLORS['sfgfp'] = 'red'
+
 
 class TestResolveVisualColor:
     """Tests for the resolve_visual_color function."""
 
-    def test_known_protein(self):
-        assert resolve_visual_color('sfGFP') == 'lime'
-
-    def test_case_insensitive(self):
-        assert resolve_visual_color('SFGFP') == 'lime'
-        assert resolve_visual_color('SfGfP') == 'lime'
-        assert resolve_visual_color('sfgfp') == 'lime'
-
-    def test_with_whitespace(self):
-        assert resolve_visual_color(' sfGFP ') == 'lime'
-
-    def test_green_maps_to_lime(self):
-        assert resolve_visual_color('green') == 'lime'
-        assert resolve_visual_color('Green') == 'lime'
-
-    def test_passthrough_unknown_color(self):
-        assert resolve_visual_color('magenta') == 'magenta'
-        assert resolve_visual_color('#ff0000') == '#ff0000'
-
-    def test_all_protein_categories(self):
-        """Verify at least one protein per color category resolves."""
-        assert resolve_visual_color('mcherry') == 'firebrick'    # red
-        assert resolve_visual_color('mko2') == 'orange'          # orange
-        assert resolve_visual_color('venus') == 'yellow'         # yellow
-        assert resolve_visual_color('mclover3') == 'green'       # green
-        assert resolve_visual_color('tagbfp') == 'blue'          # blue
-        assert resolve_visual_color('mplum') == 'purple'         # other
+    @pytest.mark.parametrize('name, expected', [
+        ('sfGFP', 'lime'),
+        # case-insensitive
+        ('SFGFP', 'lime'),
+        ('SfGfP', 'lime'),
+        ('sfgfp', 'lime'),
+        # surrounding whitespace
+        (' sfGFP ', 'lime'),
+        # plain 'green' maps to lime
+        ('green', 'lime'),
+        ('Green', 'lime'),
+        # unknown colors pass through
+        ('magenta', 'magenta'),
+        ('#ff0000', '#ff0000'),
+        # one protein per color category
+        ('mcherry', 'firebrick'),
+        ('mko2', 'orange'),
+        ('venus', 'yellow'),
+        ('mclover3', 'green'),
+        ('tagbfp', 'blue'),
+        ('mplum', 'purple'),
+    ])
+    def test_resolves(self, name, expected):
+        assert resolve_visual_color(name) == expected
+
+    def test_repeated_lookups_are_cached(self):
+        resolve_visual_color.cache_clear()
+        resolve_visual_color('mCherry')
+        resolve_visual_color('mCherry')
+        assert resolve_visual_color.cache_info().hits == 1
+
+    def test_lookup_does_not_scan(self):
+        """Resolution is a hash probe into a prebuilt table, never a loop."""
+        opnames = {ins.opname for ins in dis.get_instructions(resolve_visual_color.__wrapped__)}
+        assert 'FOR_ITER' not in opnames
+        assert 'green' not in PROTEIN_VISUAL_COLORS
@@ -1,8 +1,10 @@
 """Tests for mock Opentrons API classes."""
 
+import numpy as np
 import pytest
 from opentrons import types
 
+from opentrons_bioart_sim import mock as mock_module
 from opentrons_bioart_sim.mock import (
     LabwareMock,
     ModuleMock,
@@ -10,6 +12,7 @@ from opentrons_bioart_sim.mock import (
     PipetteSim,
     WellMock,
 )
+from opentrons_bioart_sim.visualization import rgba_table
 
 
 # ── Fixtures ──
@@ -26,9 +29,7 @@ def mock():
     return OpentronsMock(SAMPLE_WELL_COLORS)
 
 
-@pytest.fixture
-def loaded_mock(mock):
-    """A mock with labware and pipette loaded, ready for operations."""
+def _load_deck(mock):
     tips = mock.load_labware('opentrons_96_tiprack_20ul', 9, '20uL Tips')
     pipette = mock.load_instrument('p20_single_gen2', 'right', [tips])
     plate = mock.load_labware('nest_96_wellplate_2ml_deep', 6)
@@ -36,6 +37,31 @@ def loaded_mock(mock):
     return mock, pipette, plate, agar
 
 
+@pytest.fixture
+def loaded_mock(mock):
+    """A mock with labware and pipette loaded, ready for operations."""
+    return _load_deck(mock)
+
+
+@pytest.fixture(scope='class')
+def _class_loaded_mock():
+    return _load_deck(OpentronsMock(SAMPLE_WELL_COLORS))
+
+
+@pytest.fixture
+def shared_loaded_mock(_class_loaded_mock):
+    """Like ``loaded_mock``, but built once per test class.
+
+    Only for tests that leave the pipette as they found it; teardown checks
+    that no tip, liquid, or droplets are left behind.
+    """
+    yield _class_loaded_mock
+    pipette = _class_loaded_mock[1]
+    assert not pipette.has_tip
+    assert pipette.current_volume == 0
+    assert len(pipette.droplets_x) == 0
+
+
 # ── WellMock tests ──
 
 class TestWellMock:
@@ -53,8 +79,10 @@ class TestWellMock:
 
     def test_set_row_col(self):
         well = WellMock('A1', '', None)
+        well.get_row_col()
         well.set_row_col(ord('C'), 5)
         assert well.well_id == 'C5'
+        assert well.get_row_col() == (ord('C'), 5)
 
     def test_top_returns_location(self):
         well = WellMock('A1', 'sfGFP', None)
@@ -84,10 +112,26 @@ class TestWellMock:
         well = WellMock('B7', 'mRFP1', None)
         assert repr(well) == 'B7'
 
+    def test_uses_slots(self):
+        with pytest.raises(AttributeError):
+            WellMock('A1', 'sfGFP', None).volume = 5
+
+    def test_visual_color_follows_color_change(self):
+        well = WellMock('A1', 'sfGFP', None)
+        assert well.visual_color() == 'lime'
+        well.well_color = 'mCherry'
+        assert well.visual_color() == 'firebrick'
+
     def test_equality(self):
         w1 = WellMock('A1', 'sfGFP', None)
         w2 = WellMock('A1', 'sfGFP', None)
         assert w1 == w2
+        w1.get_row_col()
+        assert w1 == w2
+        assert hash(w1) == hash(w2)
+        assert w1 != WellMock('A2', 'sfGFP', None)
+        assert w1 != WellMock('A1', 'sfGFP', object())
+        assert w1 != 'A1'
 
 
 # ── LabwareMock tests ──
@@ -111,6 +155,28 @@ class TestLabwareMock:
         assert len(wells) == 3
         assert all(isinstance(w, WellMock) for w in wells)
 
+    def test_wells_are_shared(self):
+        lw = LabwareMock('test_plate', 1, 'Test', SAMPLE_WELL_COLORS)
+        assert lw['A1'] is lw.well('A1')
+        assert lw.wells()[0] is lw['A1']
+
+    def test_well_refreshed_after_color_change(self):
+        well_colors = dict(SAMPLE_WELL_COLORS)
+        lw = LabwareMock('test_plate', 1, 'Test', well_colors)
+        assert lw['B2'].color() == 'purple'
+        well_colors['B2'] = well_colors.pop('A2')
+        assert lw['B2'].color() == 'mRFP1'
+        assert lw['A2'].color() == 'purple'
+
+    def test_well_refreshed_after_set_row_col(self):
+        lw = LabwareMock('test_plate', 1, 'Test', dict(SAMPLE_WELL_COLORS))
+        moved = lw['A1']
+        moved.set_row_col(ord('C'), 5)
+        well = lw['A1']
+        assert well.well_id == 'A1'
+        assert well.get_row_col() == (ord('A'), 1)
+        assert moved.well_id == 'C5'
+
     def test_set_offset_noop(self):
         lw = LabwareMock('test_plate', 1, 'Test', SAMPLE_WELL_COLORS)
         lw.set_offset(x=1, y=2, z=3)  # Should not raise
@@ -158,15 +224,15 @@ class TestPipetteSim:
         pipette.drop_tip()
         assert not pipette.has_tip
 
-    def test_pick_up_tip_twice_raises(self, loaded_mock):
-        _, pipette, _, _ = loaded_mock
+    def test_pick_up_tip_twice_raises(self, shared_loaded_mock):
+        _, pipette, _, _ = shared_loaded_mock
         pipette.pick_up_tip()
         with pytest.raises(RuntimeError, match="already holding"):
             pipette.pick_up_tip()
         pipette.drop_tip()
 
-    def test_drop_tip_without_tip_raises(self, loaded_mock):
-        _, pipette, _, _ = loaded_mock
+    def test_drop_tip_without_tip_raises(self, shared_loaded_mock):
+        _, pipette, _, _ = shared_loaded_mock
         with pytest.raises(RuntimeError, match="without a tip"):
             pipette.drop_tip()
 
@@ -182,13 +248,13 @@ class TestPipetteSim:
 
         pipette.drop_tip()
 
-    def test_aspirate_without_tip_raises(self, loaded_mock):
-        _, pipette, plate, _ = loaded_mock
+    def test_aspirate_without_tip_raises(self, shared_loaded_mock):
+        _, pipette, plate, _ = shared_loaded_mock
         with pytest.raises(RuntimeError, match="without a tip"):
             pipette.aspirate(5, plate['A1'])
 
-    def test_dispense_without_tip_raises(self, loaded_mock):
-        _, pipette, _, agar = loaded_mock
+    def test_dispense_without_tip_raises(self, shared_loaded_mock):
+        _, pipette, _, agar = shared_loaded_mock
         loc = agar['A1'].top().move(types.Point(0, 0, 0))
         with pytest.raises(RuntimeError, match="without a tip"):
             pipette.dispense(5, loc)
@@ -224,8 +290,78 @@ class TestPipetteSim:
 
         pipette.drop_tip()
 
-    def test_noop_methods(self, loaded_mock):
-        _, pipette, _, _ = loaded_mock
+    def test_droplet_storage_grows(self, mock, monkeypatch):
+        monkeypatch.setattr(mock_module, '_INITIAL_DROPLET_CAPACITY', 2)
+        tips = mock.load_labware('opentrons_96_tiprack_20ul', 9)
+        pipette = mock.load_instrument('p20_single_gen2', 'right', [tips])
+        plate = mock.load_labware('nest_96_wellplate_2ml_deep', 6)
+        agar = mock.load_labware('htgaa_agar_plate', 5)
+        pipette.pick_up_tip()
+        pipette.aspirate(5, plate['A1'])
+        for i in range(5):
+            pipette.dispense(1, agar['A1'].top().move(types.Point(i, -i, 0)))
+        pipette.drop_tip()
+
+        assert pipette.droplets_x.tolist() == [0, 1, 2, 3, 4]
+        assert pipette.droplets_y.tolist() == [0, -1, -2, -3, -4]
+        assert pipette.droplets_color == ['lime'] * 5
+
+    def test_dispense_many_matches_single_dispenses(self, loaded_mock):
+        _, pipette, plate, agar = loaded_mock
+        pipette.pick_up_tip()
+        pipette.aspirate(10, plate['A1'])
+        pipette.dispense(1, agar['A1'].top().move(types.Point(5, 5, 0)))
+        pipette.dispense_many([1, 2, 1], [0, 1, 2], [0, -1, -2])
+
+        assert pipette.droplets_x.tolist() == [5, 0, 1, 2]
+        assert pipette.droplets_y.tolist() == [5, 0, -1, -2]
+        assert pipette.droplets_size.tolist() == [100, 100, 200, 100]
+        assert pipette.droplets_color == ['lime'] * 4
+        assert pipette.smears == [([5, 2.5], [5, 2.5], 'lime')]  # only the pending one
+        assert pipette.current_volume == 5
+        assert pipette.totalDispensed['sfGFP'] == 5
+        pipette.drop_tip()
+        assert len(pipette.smears) == 1
+
+    def test_dispense_many_validates_batch(self, loaded_mock):
+        _, pipette, plate, _ = loaded_mock
+        with pytest.raises(RuntimeError, match="without a tip"):
+            pipette.dispense_many(1, [0], [0])
+        pipette.pick_up_tip()
+        pipette.aspirate(5, plate['A1'])
+        with pytest.raises(ValueError, match="outside safe area"):
+            pipette.dispense_many(1, [0, 100], [0, 0])
+        with pytest.raises(ValueError, match="only"):
+            pipette.dispense_many(2, [0, 1, 2], [0, 0, 0])
+        with pytest.raises(ValueError, match="positive"):
+            pipette.dispense_many([1, 0], [0, 1], [0, 0])
+        assert len(pipette.droplets_x) == 0
+        assert pipette.current_volume == 5
+        pipette.drop_tip()
+
+    def test_volume_totals_by_color(self, loaded_mock):
+        _, pipette, plate, agar = loaded_mock
+        pipette.pick_up_tip()
+        pipette.aspirate(4, plate['A2'])
+        pipette.dispense(1, agar['A1'].top())
+        pipette.dispense(1.5, agar['A1'].top().move(types.Point(1, 0, 0)))
+        pipette.drop_tip()
+        assert pipette.totalAspirated == {'mRFP1': 4}
+        assert pipette.totalDispensed == {'mRFP1': 2.5}
+
+    def test_volume_totals_grow_with_palette(self):
+        tips = LabwareMock('opentrons_96_tiprack_20ul', 9, '', {})
+        well_colors = {'A1': 'sfGFP'}
+        pipette = PipetteSim('p20_single_gen2', 'right', [tips], well_colors)
+        plate = LabwareMock('nest_96_wellplate_2ml_deep', 6, '', well_colors)
+        pipette.pick_up_tip()
+        pipette.aspirate(2, plate['A1'])
+        pipette.dispense(2, types.Location(types.Point(0, 0, 0), 'Well'))
+        pipette.drop_tip()
+        assert pipette.totalAspirated == pipette.totalDispensed == {'sfGFP': 2}
+
+    def test_noop_methods(self, shared_loaded_mock):
+        _, pipette, _, _ = shared_loaded_mock
         pipette.blow_out()
         pipette.touch_tip()
         pipette.mix(repetitions=3)
@@ -248,12 +384,38 @@ class TestOpentronsMock:
         assert isinstance(pipette, PipetteSim)
         assert mock.pipette is pipette
 
+    def test_color_palette_is_shared_with_pipette(self, loaded_mock):
+        mock, pipette, plate, agar = loaded_mock
+        assert list(mock._color_index) == [
+            'Azurite', 'mRFP1', 'orange', 'purple', 'sfGFP', 'white',
+        ]
+        pipette.pick_up_tip()
+        pipette.aspirate(2, plate['A2'])
+        pipette.dispense(1, agar['A1'].top())
+        assert pipette._dcolor_idx[0] == mock._color_index['mRFP1']
+        assert pipette.droplets_color == ['red']
+        pipette.drop_tip()
+
     def test_noop_methods(self, mock):
         mock.home()
         mock.pause("testing")
         mock.comment("hello")
         mock.delay(seconds=5, minutes=1, msg="waiting")
 
+    def test_visualize_ignores_unused_unknown_deck_color(self):
+        """Deck colors that were never dispensed need not be matplotlib colors."""
+        mock = OpentronsMock({'A1': 'sfGFP', 'A2': 'mScarlet3'})
+        _, pipette, plate, agar = _load_deck(mock)
+        pipette.pick_up_tip()
+        pipette.aspirate(2, plate['A1'])
+        pipette.dispense(1, agar['A1'].top())
+        pipette.dispense(1, agar['A1'].top().move(types.Point(3, 0, 0)))
+        pipette.drop_tip()
+        fig, ax = mock.visualize(headless=True, print_summary=False)
+        droplets, smears = ax.collections
+        assert np.allclose(droplets.get_facecolors(), rgba_table(['lime', 'lime']))
+        assert np.allclose(smears.get_colors(), rgba_table(['lime']))
+
     def test_visualize_without_pipette(self, mock):
         result = mock.visualize(show=False)
         assert result is None
@@ -272,20 +434,20 @@ class TestOpentronsMock:
 # ── Additional edge-case tests ──
 
 class TestPipetteSimEdgeCases:
-    def test_move_to_negative_z_raises(self, loaded_mock):
-        _, pipette, _, _ = loaded_mock
+    def test_move_to_negative_z_raises(self, shared_loaded_mock):
+        _, pipette, _, _ = shared_loaded_mock
         with pytest.raises(ValueError, match="cannot go below z=0"):
             pipette.move_to(types.Location(types.Point(0, 0, -1), None))
 
-    def test_negative_aspirate_volume_raises(self, loaded_mock):
-        _, pipette, plate, _ = loaded_mock
+    def test_negative_aspirate_volume_raises(self, shared_loaded_mock):
+        _, pipette, plate, _ = shared_loaded_mock
         pipette.pick_up_tip()
         with pytest.raises(ValueError, match="positive"):
             pipette.aspirate(-1, plate['A1'])
         pipette.drop_tip()
 
-    def test_negative_dispense_volume_raises(self, loaded_mock):
-        _, pipette, plate, agar = loaded_mock
+    def test_negative_dispense_volume_raises(self, shared_loaded_mock):
+        _, pipette, plate, agar = shared_loaded_mock
         pipette.pick_up_tip()
         pipette.aspirate(5, plate['A1'])
         loc = agar['A1'].top().move(types.Point(0, 0, 0))
@@ -303,7 +465,43 @@ class TestPipetteSimEdgeCases:
         # Move to a different location right after dispensing (triggers smear)
         loc2 = agar['A1'].top().move(types.Point(5, 5, 0))
         pipette.dispense(2, loc2)
-        assert len(pipette.smears) >= 1
+        assert pipette.smears == [([0, 2.5], [0, 2.5], 'lime')]
+        pipette.drop_tip()
+
+    def test_smear_starts_at_assigned_just_dispensed_at(self, loaded_mock):
+        """Setting justDispensedAt directly (notebook-era API) still smears from it."""
+        _, pipette, plate, agar = loaded_mock
+        pipette.pick_up_tip()
+        pipette.aspirate(5, plate['A1'])
+        pipette.justDispensedAt = agar['A1'].top().move(types.Point(2, 2, 0))
+        pipette.dispense(1, agar['A1'].top().move(types.Point(4, 0, 0)))
+        assert pipette.smears == [([2, 3], [2, 1], 'lime')]
+        pipette.drop_tip()
+
+    def test_dispense_into_well_raises_type_error(self, shared_loaded_mock):
+        _, pipette, plate, _ = shared_loaded_mock
+        pipette.pick_up_tip()
+        pipette.aspirate(5, plate['A1'])
+        with pytest.raises(TypeError, match="types.Location"):
+            pipette.dispense(1, plate['A1'])
+        pipette.drop_tip()
+
+    def test_numpy_volumes_accepted(self, loaded_mock):
+        _, pipette, plate, agar = loaded_mock
+        pipette.pick_up_tip()
+        pipette.aspirate(np.float64(5), plate['A1'])
+        pipette.dispense(np.float64(1.5), agar['A1'].top(np.float64(0)))
+        assert pipette.current_volume == 3.5
+        pipette.drop_tip()
+
+    def test_vertical_jog_does_not_smear(self, loaded_mock):
+        _, pipette, plate, agar = loaded_mock
+        pipette.pick_up_tip()
+        pipette.aspirate(10, plate['A1'])
+        loc = agar['A1'].top().move(types.Point(3, 4, 0))
+        pipette.dispense(2, loc)
+        pipette.move_to(loc.move(types.Point(z=2)))
+        assert pipette.smears == []
         pipette.drop_tip()
 
     def test_cross_contamination_raises(self, loaded_mock):
@@ -315,6 +513,25 @@ class TestPipetteSimEdgeCases:
             pipette.aspirate(5, plate['A2'])
         pipette.drop_tip()
 
+    def test_aspirate_from_unconfigured_well_raises(self, shared_loaded_mock):
+        _, pipette, plate, _ = shared_loaded_mock
+        pipette.pick_up_tip()
+        with pytest.raises(ValueError, match="no configured color"):
+            pipette.aspirate(5, plate['H12'])
+        pipette.drop_tip()
+
+    def test_aspirate_from_well_added_after_load(self):
+        """A color rolling over to the next row adds a well ID mid-run."""
+        mock = OpentronsMock(dict(SAMPLE_WELL_COLORS))
+        tips = mock.load_labware('opentrons_96_tiprack_20ul', 9)
+        pipette = mock.load_instrument('p20_single_gen2', 'right', [tips])
+        plate = mock.load_labware('nest_96_wellplate_2ml_deep', 6)
+        mock.well_colors['B2'] = mock.well_colors.pop('A2')
+        pipette.pick_up_tip()
+        pipette.aspirate(5, plate['B2'])
+        assert pipette.curr_color == 'mRFP1'
+        pipette.drop_tip()
+
 
 class TestModuleMockEdgeCases:
     def test_float_temperature(self):
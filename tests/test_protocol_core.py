@@ -0,0 +1,157 @@
+"""Tests for the shared example-protocol core."""
+
+import numpy as np
+import pytest
+
+from opentrons_bioart_sim import _protocol_core
+from opentrons_bioart_sim._protocol_core import (
+    WELL_COLORS,
+    _column_order,
+    _nn_order,
+    run_protocol,
+)
+from opentrons_bioart_sim.mock import OpentronsMock
+
+
+def _run(point_name_pairing, point_size=1, well_colors=None, **kwargs):
+    well_colors = dict(WELL_COLORS) if well_colors is None else well_colors
+    mock = OpentronsMock(well_colors)
+    run_protocol(mock, point_name_pairing, point_size, well_colors, **kwargs)
+    return mock
+
+
+class TestRunProtocol:
+    def test_one_droplet_per_point(self):
+        mock = _run([('mrfp1', [(0, 0), (1, 1)]), ('sfgfp', [(2, 2)])])
+        assert mock.pipette.droplets_x.tolist() == [0, 1, 2]
+        assert mock.pipette.droplets_y.tolist() == [0, 1, 2]
+        assert mock.pipette.droplets_color == ['red', 'red', 'lime']
+
+    def test_one_tip_per_color(self):
+        mock = _run([('mrfp1', [(0, 0)]), ('sfgfp', [(1, 1)]), ('azurite', [(2, 2)])])
+        assert mock.pipette.tip_count == 3
+        assert not mock.pipette.has_tip
+
+    def test_empty_point_list_is_skipped(self):
+        mock = _run([('mrfp1', []), ('sfgfp', [(1, 1)])])
+        assert mock.pipette.tip_count == 1
+
+    def test_accepts_point_arrays(self):
+        points = np.array([(0, 0), (1.5, -2)], dtype=np.float64)
+        mock = _run([('mrfp1', points), ('sfgfp', np.empty((0, 2)))])
+        assert mock.pipette.droplets_x.tolist() == [0, 1.5]
+        assert mock.pipette.droplets_y.tolist() == [0, -2]
+        assert mock.pipette.tip_count == 1
+
+    def test_refills_when_pipette_runs_dry(self):
+        points = [(float(i % 10), float(i // 10)) for i in range(25)]
+        mock = _run([('mrfp1', points)])
+        assert len(mock.pipette.droplets_x) == 25
+        assert mock.pipette.totalDispensed['mRFP1'] == 25
+
+    def test_aspirates_only_what_it_dispenses(self):
+        points = [(float(i % 10), float(i // 10)) for i in range(25)]
+        mock = _run([('mrfp1', points)], point_size=0.75)
+        assert mock.pipette.totalAspirated == mock.pipette.totalDispensed
+
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    def test_unknown_color_raises(self):
+        with pytest.raises(ValueError, match="No well found"):
+            _run([('not_a_protein', [(0, 0)])])
+
+    def test_color_moves_to_next_row_when_well_runs_dry(self, monkeypatch):
+        monkeypatch.setattr(_protocol_core, 'WELL_MAX_VOLUME', 3)
+        well_colors = {'A1': 'sfGFP', 'A2': 'mRFP1'}
+        points = [(0, 0), (1, 1), (2, 2)]
+        _run([('mrfp1', points), ('mrfp1', points)], well_colors=well_colors)
+        assert well_colors == {'A1': 'sfGFP', 'B2': 'mRFP1'}
+
+    def test_single_color_over_well_volume_rolls_over_with_new_tip(self):
+        well_colors = {'A1': 'sfGFP'}
+        points = [(float(i % 20), float(i // 20)) for i in range(300)]
+        mock = _run([('sfgfp', points)], well_colors=well_colors)
+        assert len(mock.pipette.droplets_x) == 300
+        assert mock.pipette.totalDispensed == {'sfGFP': 300}
+        assert mock.pipette.tip_count == 2
+        assert well_colors == {'B1': 'sfGFP'}
+
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    def test_rollover_onto_occupied_well_raises(self):
+        well_colors = dict(WELL_COLORS)
+        points = [(float(i % 20), float(i // 20)) for i in range(300)]
+        with pytest.raises(ValueError, match="B1 already holds Electra2"):
+            _run([('sfgfp', points)], well_colors=well_colors)
+        assert well_colors['B1'] == 'Electra2'
+
+    @pytest.mark.filterwarnings("ignore::RuntimeWarning")
+    def test_rollover_off_the_plate_raises(self, monkeypatch):
+        monkeypatch.setattr(_protocol_core, 'WELL_MAX_VOLUME', 3)
+        points = [(0, 0), (1, 1), (2, 2)]
+        with pytest.raises(ValueError, match="off the plate"):
+            _run([('mrfp1', points), ('mrfp1', points)], well_colors={'H2': 'mRFP1'})
+
+    def test_baseline_well_colors_are_read_only(self):
+        with pytest.raises(TypeError):
+            WELL_COLORS['A1'] = 'mRFP1'
+
+    def test_given_point_order_keeps_list_order(self):
+        points = [(3, 0), (0, 0), (2, 0), (1, 0)]
+        mock = _run([('mrfp1', points)], point_order='given')
+        assert mock.pipette.droplets_x.tolist() == [3, 0, 2, 1]
+
+    def test_unknown_point_order_raises(self):
+        with pytest.raises(ValueError, match="point_order"):
+            _run([('mrfp1', [(0, 0)])], point_order='random')
+
+    def test_default_well_colors_are_not_mutated(self, monkeypatch):
+        monkeypatch.setattr(_protocol_core, 'WELL_MAX_VOLUME', 3)
+        points = [(0, 0), (1, 1), (2, 2)]
+        # C11's next-row well is free in the default layout
+        mock = OpentronsMock({**WELL_COLORS, 'D11': 'mHoneydew'})
+        run_protocol(mock, [('mhoneydew', points), ('mhoneydew', points)], 1)
+        assert WELL_COLORS['C11'] == 'mHoneydew'
+        assert 'D11' not in WELL_COLORS
+
+
+def _path_length(points):
+    return np.linalg.norm(np.diff(points, axis=0), axis=1).sum()
+
+
+class TestNearestNeighborOrder:
+    def test_keeps_every_point(self):
+        points = np.array([(5, 0), (0, 0), (5, 1), (0, 1), (2, 2)], dtype=np.float64)
+        ordered = _nn_order(points)
+        assert sorted(map(tuple, ordered)) == sorted(map(tuple, points))
+
+    def test_starts_at_leftmost_point(self):
+        points = np.array([(5, 0), (0, 3), (5, 1), (0, 1), (2, 2)], dtype=np.float64)
+        assert tuple(_nn_order(points)[0]) == (0, 1)
+
+    def test_shortens_zigzag_path(self):
+        zigzag = np.array([(x, y) for y in range(4) for x in (0, 9, 1, 8, 2, 7)],
+                          dtype=np.float64)
+        assert _path_length(_nn_order(zigzag)) < _path_length(zigzag)
+
+    def test_short_lists_unchanged(self):
+        points = np.array([(3, 0), (0, 0), (1, 0)], dtype=np.float64)
+        assert _nn_order(points) is points
+
+
+class TestColumnOrder:
+    def test_groups_by_column_and_snakes(self):
+        points = np.array([(2.2, 0), (0, 1), (2.2, 1), (0, 0), (4.4, 1), (4.4, 0)],
+                          dtype=np.float64)
+        ordered = [tuple(p) for p in _column_order(points)]
+        assert ordered == [(0, 0), (0, 1), (2.2, 1), (2.2, 0), (4.4, 0), (4.4, 1)]
+
+    def test_keeps_every_point(self):
+        points = np.array([(5, 0), (0, 0), (5, 1), (0, 1), (2, 2)], dtype=np.float64)
+        ordered = _column_order(points)
+        assert sorted(map(tuple, ordered)) == sorted(map(tuple, points))
+
+    def test_grid_on_multiples_of_tol_keeps_columns_apart(self):
+        points = np.array([(x, y) for y in (0, 1) for x in (0, 2.2, 4.4, 6.6)],
+                          dtype=np.float64)
+        ordered = [tuple(p) for p in _column_order(points)]
+        assert ordered == [(0, 0), (0, 1), (2.2, 1), (2.2, 0),
+                           (4.4, 0), (4.4, 1), (6.6, 1), (6.6, 0)]
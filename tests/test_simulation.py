@@ -1,10 +1,12 @@
 """Tests for end-to-end protocol simulation."""
 
+import importlib.util
 import os
-import tempfile
+import sys
 
 import pytest
 
+from opentrons_bioart_sim import mock as mock_module
 from opentrons_bioart_sim import simulate_protocol
 
 
@@ -12,44 +14,102 @@ EXAMPLES_DIR = os.path.join(os.path.dirname(__file__), '..', 'examples')
 
 
 class TestSimulateProtocol:
-    def test_octocat_runs_successfully(self):
+    """End-to-end runs of simulate_protocol."""
+
+    def test_octocat_runs_successfully(self, octocat_mock):
         """Run the octocat example end-to-end without display."""
-        protocol_path = os.path.join(EXAMPLES_DIR, 'octocat.py')
-        if not os.path.exists(protocol_path):
-            pytest.skip("octocat.py example not found")
+        assert octocat_mock.pipette is not None
+        assert octocat_mock.pipette.tip_count > 0
+        assert len(octocat_mock.pipette.droplets_x) > 0
 
-        mock = simulate_protocol(protocol_path, show=False)
-        assert mock.pipette is not None
-        assert mock.pipette.tip_count > 0
+    def test_art_designer_export_runs(self):
+        """A verbatim Opentrons Art Designer export simulates end to end."""
+        path = os.path.join(EXAMPLES_DIR, 'OTDesign_02-23-26_18-57-12.py')
+        mock = simulate_protocol(path, show=False, headless=True)
         assert len(mock.pipette.droplets_x) > 0
+        assert not mock.pipette.has_tip
 
-    def test_simulate_with_save(self):
-        """Verify that --save creates an image file."""
-        protocol_path = os.path.join(EXAMPLES_DIR, 'octocat.py')
-        if not os.path.exists(protocol_path):
-            pytest.skip("octocat.py example not found")
-
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as f:
-            save_path = f.name
-
-        try:
-            simulate_protocol(protocol_path, show=False, save_path=save_path)
-            assert os.path.exists(save_path)
-            assert os.path.getsize(save_path) > 0
-        finally:
-            if os.path.exists(save_path):
-                os.unlink(save_path)
+    def test_simulate_with_save(self, tiny_protocol_path, tmp_path):
+        """Verify that save_path creates an image file."""
+        save_path = tmp_path / 'tiny.png'
+        simulate_protocol(tiny_protocol_path, save_path=str(save_path), show=False,
+                          headless=True)
+        assert save_path.stat().st_size > 0
 
     def test_file_not_found_raises(self):
         with pytest.raises(FileNotFoundError):
             simulate_protocol('nonexistent_protocol.py', show=False)
 
-    def test_different_backgrounds(self):
-        """Verify all three background options work without error."""
-        protocol_path = os.path.join(EXAMPLES_DIR, 'octocat.py')
-        if not os.path.exists(protocol_path):
-            pytest.skip("octocat.py example not found")
+    @pytest.mark.parametrize('bg', ['black', 'agar', 'paper'])
+    def test_different_backgrounds(self, tiny_protocol_path, bg):
+        """Verify all three background options render without error."""
+        mock = simulate_protocol(tiny_protocol_path, background=bg, show=False, headless=True)
+        assert len(mock.pipette.droplets_x) == 2
+
+
+PROTOCOL_SOURCE = '''
+from opentrons import types
+
+well_colors = {'A1': 'sfGFP'}
+runs = []
+
+
+def run(protocol):
+    runs.append(1)
+    tips = protocol.load_labware('opentrons_96_tiprack_20ul', 9)
+    pipette = protocol.load_instrument('p20_single_gen2', 'right', [tips])
+    plate = protocol.load_labware('nest_96_wellplate_2ml_deep', 6)
+    agar = protocol.load_labware('htgaa_agar_plate', 5)
+    pipette.pick_up_tip()
+    pipette.aspirate(DROPS, plate['A1'])
+    for i in range(DROPS):
+        pipette.dispense(1, agar['A1'].top().move(types.Point(i, 0, 0)))
+    pipette.drop_tip()
+'''
+
+
+class TestProtocolCache:
+    def teardown_method(self):
+        import matplotlib.pyplot as plt
+        plt.close('all')
+
+    def _write(self, path, drops):
+        path.write_text(f"DROPS = {drops}\n" + PROTOCOL_SOURCE)
+
+    def test_compiles_once_and_runs_in_fresh_module(self, tmp_path):
+        path = tmp_path / 'protocol.py'
+        self._write(path, 2)
+        mod1 = mock_module._load_protocol(str(path))
+        code = mock_module._protocol_code_cache[str(path)][1]
+        mod2 = mock_module._load_protocol(str(path))
+        assert mock_module._protocol_code_cache[str(path)][1] is code
+        assert mod1 is not mod2 and mod1.runs is not mod2.runs
+
+    def test_repeat_simulations_compile_once(self, tmp_path, monkeypatch):
+        from importlib.machinery import SourceFileLoader
+
+        compiled = []
+        get_code = SourceFileLoader.get_code
+        monkeypatch.setattr(SourceFileLoader, 'get_code',
+                            lambda self, name: compiled.append(name) or get_code(self, name))
+        path = tmp_path / 'protocol.py'
+        self._write(path, 1)
+        for _ in range(3):
+            simulate_protocol(str(path), show=False, headless=True)
+        assert len(compiled) == 1
+
+    def test_bytecode_written_to_pycache(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(sys, 'dont_write_bytecode', False)
+        path = tmp_path / 'protocol.py'
+        self._write(path, 1)
+        mock_module._load_protocol(str(path))
+        assert os.path.exists(importlib.util.cache_from_source(str(path)))
 
-        for bg in ['black', 'agar', 'paper']:
-            mock = simulate_protocol(protocol_path, background=bg, show=False)
-            assert mock.pipette is not None
+    def test_edited_file_is_recompiled(self, tmp_path):
+        path = tmp_path / 'protocol.py'
+        self._write(path, 2)
+        assert len(simulate_protocol(str(path), show=False).pipette.droplets_x) == 2
+        self._write(path, 3)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+        assert len(simulate_protocol(str(path), show=False).pipette.droplets_x) == 3
@@ -3,71 +3,166 @@
 import matplotlib
 matplotlib.use('Agg')  # non-interactive backend for CI
 
-from opentrons_bioart_sim.visualization import visualize_petri
+import subprocess
+import sys
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.collections import LineCollection
+
+from opentrons_bioart_sim.visualization import (
+    _build_petri_scene,
+    _print_volume_summary,
+    rgba_table,
+    visualize_petri,
+    visualize_petri_headless,
+)
+
+
+def _base_args():
+    return dict(
+        droplets_x=[0, 1, -1],
+        droplets_y=[0, 1, -1],
+        droplets_size=[100, 200, 150],
+        droplets_color=['red', 'lime', 'blue'],
+        smears=[],
+    )
+
+
+class TestBuildPetriScene:
+    """Scene construction, checked without creating any matplotlib objects."""
+
+    def _scene(self, background='black', **overrides):
+        args = {**_base_args(), 'smear_colors': None, **overrides}
+        return _build_petri_scene(**args, background=background, title='t')
+
+    @pytest.mark.parametrize('background, color, fill', [
+        ('black', '#000000', True),
+        ('agar', '#d7ca95', True),
+        ('paper', '#000000', False),
+        ('unknown', '#000000', True),  # falls back to black
+    ])
+    def test_backgrounds(self, background, color, fill):
+        scene = self._scene(background)
+        assert (scene.dish_color, scene.dish_fill) == (color, fill)
+
+    def test_droplets(self):
+        scene = self._scene()
+        assert scene.droplet_offsets.tolist() == [[0, 0], [1, 1], [-1, -1]]
+        assert scene.droplet_sizes.tolist() == [100, 200, 150]
+
+    def test_empty_droplets(self):
+        scene = self._scene(droplets_x=[], droplets_y=[], droplets_size=[],
+                            droplets_color=[])
+        assert len(scene.droplet_sizes) == 0
+        assert scene.droplet_offsets.shape == (0, 2)
+
+    def test_smear_tuples_become_segments(self):
+        scene = self._scene(smears=[([0, 1], [0, 1], 'red'), ([1, 2], [0, 0], 'lime')])
+        assert scene.smear_segments == [[(0, 0), (1, 1)], [(1, 0), (2, 0)]]
+        assert scene.smear_colors == ['red', 'lime']
+
+    def test_smear_segment_array_passes_through(self):
+        segs = np.array([[[0, 0], [1, 1]]], dtype=np.float64)
+        scene = self._scene(smears=segs, smear_colors=['red'])
+        assert scene.smear_segments is segs
+
+
+@pytest.fixture(scope='module')
+def shared_fig():
+    """One pyplot figure reused by every rendering test in this module."""
+    fig, ax = plt.subplots()
+    yield fig, ax
+    plt.close(fig)
+
+
+@pytest.fixture
+def shared_ax(shared_fig):
+    _, ax = shared_fig
+    ax.clear()
+    return ax
 
 
 class TestVisualizePetri:
-    def _base_args(self):
+    def _args(self):
         return dict(
-            droplets_x=[0, 1, -1],
-            droplets_y=[0, 1, -1],
-            droplets_size=[100, 200, 150],
-            droplets_color=['red', 'lime', 'blue'],
-            smears=[],
+            **_base_args(),
             total_aspirated={'red': 5.0, 'lime': 3.0},
             total_dispensed={'red': 5.0, 'lime': 3.0},
             tip_count=2,
         )
 
-    def test_returns_figure_and_axes(self):
-        fig, ax = visualize_petri(**self._base_args(), show=False)
-        assert fig is not None
-        assert ax is not None
-
-    def test_black_background(self):
-        fig, ax = visualize_petri(**self._base_args(), background='black', show=False)
-        patches = ax.patches
-        assert len(patches) == 1  # the petri dish circle
+    def test_returns_figure_and_axes(self, shared_fig, shared_ax):
+        fig, ax = visualize_petri(**self._args(), show=False, ax=shared_ax)
+        assert (fig, ax) == shared_fig
+        assert len(ax.patches) == 1  # the petri dish circle
+        assert len(ax.collections) == 1
 
-    def test_agar_background(self):
-        fig, ax = visualize_petri(**self._base_args(), background='agar', show=False)
-        assert fig is not None
+    def test_creates_figure_without_ax(self):
+        open_figures = len(plt.get_fignums())
+        fig, ax = visualize_petri(**self._args(), show=False)
+        assert len(plt.get_fignums()) == open_figures + 1
+        plt.close(fig)
 
-    def test_paper_background(self):
-        fig, ax = visualize_petri(**self._base_args(), background='paper', show=False)
-        assert fig is not None
+    def test_droplet_colors_by_name_or_rgba_match(self, shared_ax):
+        args = self._args()
+        visualize_petri(**args, show=False, ax=shared_ax)
+        by_name = shared_ax.collections[0].get_facecolors().copy()
+        assert shared_ax.collections[0].get_sizes().tolist() == [100, 200, 150]
+        shared_ax.clear()
+        args['droplets_color'] = rgba_table(args['droplets_color'])
+        visualize_petri(**args, show=False, ax=shared_ax)
+        assert np.array_equal(by_name, shared_ax.collections[0].get_facecolors())
 
-    def test_unknown_background_defaults_to_black(self):
-        fig, ax = visualize_petri(**self._base_args(), background='unknown', show=False)
-        assert fig is not None
-
-    def test_empty_droplets(self):
-        fig, ax = visualize_petri(
-            droplets_x=[], droplets_y=[], droplets_size=[], droplets_color=[],
-            smears=[], total_aspirated={}, total_dispensed={}, tip_count=0,
-            show=False,
-        )
-        assert fig is not None
+    def test_rgba_table(self):
+        table = rgba_table(['red', 'blue'])
+        assert table.shape == (2, 4)
+        assert np.allclose(table[0], (1, 0, 0, 1))
+        assert rgba_table([]).shape == (0, 4)
 
-    def test_with_smears(self):
-        args = self._base_args()
-        args['smears'] = [([0, 1], [0, 1], 'red')]
-        fig, ax = visualize_petri(**args, show=False)
-        assert len(ax.lines) >= 1
+    def test_smears_drawn_as_one_collection(self, shared_ax):
+        args = self._args()
+        args['smears'] = np.array([[[0, 0], [1, 1]], [[1, 0], [2, 0]]], dtype=np.float64)
+        args['smear_colors'] = rgba_table(['red', 'lime'])
+        fig, ax = visualize_petri(**args, show=False, ax=shared_ax)
+        smears = [c for c in ax.collections if isinstance(c, LineCollection)]
+        assert len(smears) == 1
+        assert smears[0].get_segments()[0].tolist() == [[0, 0], [1, 1]]
 
-    def test_save_creates_file(self, tmp_path):
-        save_path = str(tmp_path / 'test_output.png')
-        fig, ax = visualize_petri(**self._base_args(), show=False, save_path=save_path)
-        import os
-        assert os.path.exists(save_path)
-        assert os.path.getsize(save_path) > 0
+    def test_save_creates_file(self, shared_ax, tmp_path):
+        save_path = tmp_path / 'test_output.png'
+        visualize_petri(**self._args(), show=False, save_path=str(save_path), ax=shared_ax)
+        assert save_path.stat().st_size > 0
 
     def test_waste_warning_printed(self, capsys):
         """If aspirated > dispensed, a WASTE warning should appear."""
-        fig, ax = visualize_petri(
-            droplets_x=[0], droplets_y=[0], droplets_size=[100], droplets_color=['red'],
-            smears=[], total_aspirated={'red': 10.0}, total_dispensed={'red': 5.0},
-            tip_count=1, show=False,
-        )
+        _print_volume_summary({'red': 10.0}, {'red': 5.0}, tip_count=1)
         captured = capsys.readouterr()
         assert 'WASTE' in captured.out
+
+    def test_summary_can_be_suppressed(self, capsys):
+        visualize_petri_headless(**self._args(), print_summary=False)
+        assert capsys.readouterr().out == ''
+
+
+class TestHeadless:
+    def test_headless_saves_without_pyplot(self, tmp_path):
+        save_path = tmp_path / 'headless.png'
+        open_figures = plt.get_fignums()
+        fig, ax = visualize_petri_headless(
+            droplets_x=[0, 1], droplets_y=[0, 1], droplets_size=[100, 100],
+            droplets_color=['red', 'lime'], smears=[([0, 1], [0, 1], 'red')],
+            total_aspirated={}, total_dispensed={}, tip_count=1,
+            save_path=str(save_path),
+        )
+        assert save_path.stat().st_size > 0
+        assert len(ax.collections) == 2
+        assert plt.get_fignums() == open_figures
+
+    def test_mock_import_defers_matplotlib(self):
+        code = (
+            "import sys, opentrons_bioart_sim.mock; "
+            "assert 'matplotlib' not in sys.modules"
+        )
+        subprocess.run([sys.executable, '-c', code], check=True)